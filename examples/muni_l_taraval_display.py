@@ -11,12 +11,106 @@ import requests
 import json
 from datetime import datetime, timedelta
 import threading
+from collections import OrderedDict
+from functools import lru_cache
+import numpy as np
+from PIL import Image
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from matrix.emulator_controller import EmulatorController
 
+# Simplified 5x7 font for key characters, one 5-bit row per entry (MSB = left column)
+FONT_ROWS = {
+    'L': (0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b11111),
+    'T': (0b11111, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100),
+    'A': (0b01110, 0b10001, 0b10001, 0b11111, 0b10001, 0b10001, 0b10001),
+    'R': (0b11110, 0b10001, 0b10001, 0b11110, 0b10100, 0b10010, 0b10001),
+    'V': (0b10001, 0b10001, 0b10001, 0b10001, 0b01010, 0b01010, 0b00100),
+    'E': (0b11111, 0b10000, 0b10000, 0b11110, 0b10000, 0b10000, 0b11111),
+    'M': (0b10001, 0b11011, 0b10101, 0b10001, 0b10001, 0b10001, 0b10001),
+    'I': (0b11111, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b11111),
+    'N': (0b10001, 0b11001, 0b10101, 0b10011, 0b10001, 0b10001, 0b10001),
+    'U': (0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b01110),
+    'W': (0b10001, 0b10001, 0b10001, 0b10101, 0b10101, 0b11011, 0b10001),
+    'O': (0b01110, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b01110),
+    'D': (0b11110, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b11110),
+    'P': (0b11110, 0b10001, 0b10001, 0b11110, 0b10000, 0b10000, 0b10000),
+    '0': (0b01110, 0b10001, 0b10011, 0b10101, 0b11001, 0b10001, 0b01110),
+    '1': (0b00100, 0b01100, 0b00100, 0b00100, 0b00100, 0b00100, 0b01110),
+    '2': (0b01110, 0b10001, 0b00001, 0b00010, 0b00100, 0b01000, 0b11111),
+    '3': (0b01110, 0b10001, 0b00001, 0b00110, 0b00001, 0b10001, 0b01110),
+    '4': (0b00010, 0b00110, 0b01010, 0b10010, 0b11111, 0b00010, 0b00010),
+    '5': (0b11111, 0b10000, 0b11110, 0b00001, 0b00001, 0b10001, 0b01110),
+    '6': (0b01110, 0b10000, 0b10000, 0b11110, 0b10001, 0b10001, 0b01110),
+    '7': (0b11111, 0b00001, 0b00010, 0b00100, 0b01000, 0b01000, 0b01000),
+    '8': (0b01110, 0b10001, 0b10001, 0b01110, 0b10001, 0b10001, 0b01110),
+    '9': (0b01110, 0b10001, 0b10001, 0b01111, 0b00001, 0b00001, 0b01110),
+    ':': (0b00000, 0b00100, 0b00000, 0b00000, 0b00100, 0b00000, 0b00000),
+    ' ': (0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000),
+}
+
+# Packed (N, 7) glyph table: one uint8 per glyph row, indexed per character
+GLYPH_INDEX = {char: i for i, char in enumerate(FONT_ROWS)}
+GLYPH_TABLE = np.array(list(FONT_ROWS.values()), dtype=np.uint8)
+SPACE_INDEX = GLYPH_INDEX[' ']
+
+# Glyph index for every Latin-1 code, so a whole string maps to glyphs in one array lookup;
+# characters outside the font fall back to a space
+GLYPH_LOOKUP = np.full(256, SPACE_INDEX, dtype=np.intp)
+GLYPH_LOOKUP[[ord(char) for char in GLYPH_INDEX]] = list(GLYPH_INDEX.values())
+
+# (N, 7, 6) boolean glyph masks unpacked once: each row's 5 bits plus a trailing
+# 1-pixel gap (the zero shifted in below the lowest bit)
+GLYPH_MASKS = np.unpackbits(GLYPH_TABLE[:, :, None] << 1, axis=2)[:, :, 2:].astype(bool)
+GLYPH_MASKS.flags.writeable = False
+
+
+@lru_cache(maxsize=256)
+def text_to_glyphs(text):
+    """Glyph masks for text, (len, 7, 6); cached since clock and update strings repeat."""
+    codes = np.frombuffer(text.upper().encode('latin-1', 'replace'), dtype=np.uint8)
+    glyphs = GLYPH_MASKS[GLYPH_LOOKUP[codes]]
+    glyphs.flags.writeable = False  # Shared by every caller of the cache
+    return glyphs
+
+
+def layout_text_mask(text_pixels):
+    """Lay glyph masks side by side as one 7-row strip, dropping the gap after the last character."""
+    return text_pixels.transpose(1, 0, 2).reshape(7, -1)[:, :-1]
+
+
+# Popular L-Taraval stops (real MUNI stop IDs)
+L_TARAVAL_STOPS = {
+    "Embarcadero": "13218",     # Embarcadero Station
+    "Montgomery": "13217",      # Montgomery Station
+    "Powell": "13216",          # Powell Station
+    "Civic Center": "13215",    # Civic Center Station
+    "Van Ness": "13214",        # Van Ness Station
+    "Church": "13213",          # Church Station
+    "Castro": "13212",          # Castro Station
+    "Forest Hill": "13211",     # Forest Hill Station
+    "West Portal": "13210",     # West Portal Station
+    "Sunset Blvd": "13209",     # Sunset Boulevard
+    "19th Ave": "13208",        # 19th Avenue
+    "Taraval/46th": "13207",    # Taraval & 46th Ave
+    "SF Zoo": "13206"           # SF Zoo (end of line)
+}
+
+# Arrival slots spaced across the display: (x, y) position and color
+ARRIVAL_SLOTS = (
+    ((2, 12), (255, 0, 0)),     # Red
+    ((22, 12), (255, 128, 0)),  # Orange
+    ((42, 12), (0, 255, 255)),  # Cyan
+)
+
+# Seconds between arrival updates
+UPDATE_INTERVAL = 30
+
+# Number of composed frames kept for reuse when the arrivals and clock are unchanged
+FRAME_CACHE_SIZE = 8
+
 
 class MuniLTaravalDisplay:
     """Real-time MUNI L-Taraval arrival display."""
@@ -25,6 +119,10 @@ class MuniLTaravalDisplay:
         """Initialize the MUNI display."""
         self.api_key = api_key or "YOUR_511_API_KEY_HERE"
         self.controller = EmulatorController(use_emulator=True)
+
+        # The canvas only exists with an emulator or hardware backend; check once
+        self._matrix = self.controller.matrix
+        self.has_canvas = self.controller.canvas is not None
         self.running = False
         self.arrivals_data = []
         self.last_update = None
@@ -34,25 +132,29 @@ class MuniLTaravalDisplay:
         self.line_id = "L"  # L-Taraval line
         
         # Popular L-Taraval stops (real MUNI stop IDs)
-        self.stops = {
-            "Embarcadero": "13218",     # Embarcadero Station
-            "Montgomery": "13217",      # Montgomery Station  
-            "Powell": "13216",          # Powell Station
-            "Civic Center": "13215",    # Civic Center Station
-            "Van Ness": "13214",        # Van Ness Station
-            "Church": "13213",          # Church Station
-            "Castro": "13212",          # Castro Station
-            "Forest Hill": "13211",     # Forest Hill Station
-            "West Portal": "13210",     # West Portal Station
-            "Sunset Blvd": "13209",     # Sunset Boulevard
-            "19th Ave": "13208",        # 19th Avenue
-            "Taraval/46th": "13207",    # Taraval & 46th Ave
-            "SF Zoo": "13206"           # SF Zoo (end of line)
-        }
+        self.stops = L_TARAVAL_STOPS
         
         # Default stop (you can change this to your preferred stop)
         self.current_stop = "West Portal"
         self.current_stop_id = self.stops[self.current_stop]
+
+        # Composed 64x32 RGB frames keyed by (arrival minutes, clock, update stamp)
+        self._frame_cache = OrderedDict()
+        self.frame = np.zeros((32, 64, 3), dtype=np.uint8)
+        self._shown_frame = None  # Last frame pushed to the canvas
+        self._no_data_frame = None  # The NO DATA screen, composed on first use
+
+        # Glyphs that only depend on constant text or the minutes value
+        self._header_pixels = self.create_text_pixels("L-TARAVAL")
+        self._arrival_mask_cache = {}
+
+        # Set to wake the update loop immediately on shutdown
+        self._stop_event = threading.Event()
+
+        # Latest arrivals snapshot, replaced whole by the background fetch thread; a single
+        # attribute store/load is atomic, so the render loop reads it without a lock
+        self._latest = self.get_demo_data()
+        self._fetch_thread = None
     
     def get_api_key_instructions(self):
         """Show instructions for getting a 511.org API key."""
@@ -91,120 +193,122 @@ class MuniLTaravalDisplay:
     
     def create_text_pixels(self, text):
         """Create pixel representation of text using simple 5x7 font."""
-        # Simplified font for key characters
-        font_patterns = {
-            'L': [[1,0,0,0,0],[1,0,0,0,0],[1,0,0,0,0],[1,0,0,0,0],[1,0,0,0,0],[1,0,0,0,0],[1,1,1,1,1]],
-            'T': [[1,1,1,1,1],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0]],
-            'A': [[0,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[1,1,1,1,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1]],
-            'R': [[1,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[1,1,1,1,0],[1,0,1,0,0],[1,0,0,1,0],[1,0,0,0,1]],
-            'V': [[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[0,1,0,1,0],[0,1,0,1,0],[0,0,1,0,0]],
-            'E': [[1,1,1,1,1],[1,0,0,0,0],[1,0,0,0,0],[1,1,1,1,0],[1,0,0,0,0],[1,0,0,0,0],[1,1,1,1,1]],
-            'M': [[1,0,0,0,1],[1,1,0,1,1],[1,0,1,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1]],
-            'I': [[1,1,1,1,1],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[1,1,1,1,1]],
-            'N': [[1,0,0,0,1],[1,1,0,0,1],[1,0,1,0,1],[1,0,0,1,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1]],
-            'U': [[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[0,1,1,1,0]],
-            'W': [[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,1,0,1],[1,0,1,0,1],[1,1,0,1,1],[1,0,0,0,1]],
-            'O': [[0,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[0,1,1,1,0]],
-            'D': [[1,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,1,1,1,0]],
-            'P': [[1,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[1,1,1,1,0],[1,0,0,0,0],[1,0,0,0,0],[1,0,0,0,0]],
-            '0': [[0,1,1,1,0],[1,0,0,0,1],[1,0,0,1,1],[1,0,1,0,1],[1,1,0,0,1],[1,0,0,0,1],[0,1,1,1,0]],
-            '1': [[0,0,1,0,0],[0,1,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,1,1,1,0]],
-            '2': [[0,1,1,1,0],[1,0,0,0,1],[0,0,0,0,1],[0,0,0,1,0],[0,0,1,0,0],[0,1,0,0,0],[1,1,1,1,1]],
-            '3': [[0,1,1,1,0],[1,0,0,0,1],[0,0,0,0,1],[0,0,1,1,0],[0,0,0,0,1],[1,0,0,0,1],[0,1,1,1,0]],
-            '4': [[0,0,0,1,0],[0,0,1,1,0],[0,1,0,1,0],[1,0,0,1,0],[1,1,1,1,1],[0,0,0,1,0],[0,0,0,1,0]],
-            '5': [[1,1,1,1,1],[1,0,0,0,0],[1,1,1,1,0],[0,0,0,0,1],[0,0,0,0,1],[1,0,0,0,1],[0,1,1,1,0]],
-            '6': [[0,1,1,1,0],[1,0,0,0,0],[1,0,0,0,0],[1,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[0,1,1,1,0]],
-            '7': [[1,1,1,1,1],[0,0,0,0,1],[0,0,0,1,0],[0,0,1,0,0],[0,1,0,0,0],[0,1,0,0,0],[0,1,0,0,0]],
-            '8': [[0,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[0,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[0,1,1,1,0]],
-            '9': [[0,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[0,1,1,1,1],[0,0,0,0,1],[0,0,0,0,1],[0,1,1,1,0]],
-            ':': [[0,0,0,0,0],[0,0,1,0,0],[0,0,0,0,0],[0,0,0,0,0],[0,0,1,0,0],[0,0,0,0,0],[0,0,0,0,0]],
-            ' ': [[0,0,0,0,0],[0,0,0,0,0],[0,0,0,0,0],[0,0,0,0,0],[0,0,0,0,0],[0,0,0,0,0],[0,0,0,0,0]]
-        }
-        
-        text_pixels = []
-        for char in text.upper():
-            if char in font_patterns:
-                text_pixels.append(font_patterns[char])
-            else:
-                text_pixels.append(font_patterns[' '])
-        
-        return text_pixels
+        return text_to_glyphs(text)
     
-    def display_arrivals(self):
+    def _fetch_loop(self):
+        """Refresh the arrivals snapshot off the render thread until stopped."""
+        while not self._stop_event.is_set():
+            self._latest = self.get_demo_data()  # Using demo data for now
+            self._stop_event.wait(UPDATE_INTERVAL)
+
+    def display_arrivals(self, now=None):
         """Display arrival information on the matrix."""
-        arrivals = self.get_demo_data()  # Using demo data for now
-        
+        arrivals = self._latest
+
         if not arrivals:
             self.display_no_data()
             return
         
         # Display format: "L-TARAVAL  3min  8min  15min"
-        if hasattr(self.controller, 'canvas') and self.controller.canvas:
-            self.controller.clear()
-            
-            # Header: "L-TARAVAL" in green
-            header_pixels = self.create_text_pixels("L-TARAVAL")
-            self.draw_text_pixels(header_pixels, 1, 2, (0, 255, 0))
-            
-            # Current time in top right
-            current_time = datetime.now().strftime("%H:%M")
-            time_pixels = self.create_text_pixels(current_time)
-            self.draw_text_pixels(time_pixels, 64 - len(time_pixels) * 6, 2, (255, 255, 0))
-            
-            # Arrival times
-            y_pos = 12
-            colors = [(255, 0, 0), (255, 128, 0), (0, 255, 255)]  # Red, Orange, Cyan
-            
-            for i, arrival in enumerate(arrivals[:3]):
-                if arrival['minutes'] == 0:
-                    text = "NOW"
-                elif arrival['minutes'] == 1:
-                    text = "1MIN"
-                else:
-                    text = f"{arrival['minutes']}MIN"
-                
-                text_pixels = self.create_text_pixels(text)
-                x_pos = 2 + (i * 20)  # Space arrivals across the display
-                
-                if x_pos + len(text_pixels) * 6 <= 64:  # Make sure it fits
-                    self.draw_text_pixels(text_pixels, x_pos, y_pos, colors[i])
-            
-            # Update timestamp at bottom
-            if self.last_update:
-                update_text = f"UPD {self.last_update.strftime('%H:%M')}"
-                update_pixels = self.create_text_pixels(update_text)
-                self.draw_text_pixels(update_pixels, 1, 25, (100, 100, 100))
-            
-            self.controller.canvas = self.controller.matrix.SwapOnVSync(self.controller.canvas)
-    
+        if self.has_canvas:
+            if now is None:
+                now = datetime.now()
+            current_time = now.strftime("%H:%M")
+            update_time = self.last_update.strftime('%H:%M') if self.last_update else None
+
+            # Reuse the composed frame when nothing visible has changed
+            key = (tuple(a['minutes'] for a in arrivals[:3]), current_time, update_time)
+            frame = self._frame_cache.get(key)
+            if frame is None:
+                frame = self.render_arrivals(arrivals, current_time, update_time)
+                self._frame_cache[key] = frame
+                if len(self._frame_cache) > FRAME_CACHE_SIZE:
+                    self._frame_cache.popitem(last=False)
+            else:
+                self._frame_cache.move_to_end(key)
+
+            self.present_frame(frame)
+
+    def render_arrivals(self, arrivals, current_time, update_time):
+        """Compose the arrivals screen into a fresh frame and return it."""
+        self.frame = np.zeros((32, 64, 3), dtype=np.uint8)
+
+        # Header: "L-TARAVAL" in green
+        self.draw_text_pixels(self._header_pixels, 1, 2, (0, 255, 0))
+
+        # Current time in top right
+        time_pixels = self.create_text_pixels(current_time)
+        self.draw_text_pixels(time_pixels, 64 - len(time_pixels) * 6, 2, (255, 255, 0))
+
+        # Arrival times
+        for arrival, ((x_pos, y_pos), color) in zip(arrivals, ARRIVAL_SLOTS):
+            text_mask = self.get_arrival_mask(arrival['minutes'])
+
+            if x_pos + text_mask.shape[1] + 1 <= 64:  # Make sure it fits
+                self.draw_text_mask(text_mask, x_pos, y_pos, color)
+
+        # Update timestamp at bottom
+        if update_time:
+            update_pixels = self.create_text_pixels(f"UPD {update_time}")
+            self.draw_text_pixels(update_pixels, 1, 25, (100, 100, 100))
+
+        return self.frame
+
+    def get_arrival_mask(self, minutes):
+        """Return the laid-out text mask for an arrival time, built once per minutes value."""
+        text_mask = self._arrival_mask_cache.get(minutes)
+        if text_mask is None:
+            if minutes == 0:
+                text = "NOW"
+            elif minutes == 1:
+                text = "1MIN"
+            else:
+                text = f"{minutes}MIN"
+            text_mask = self._arrival_mask_cache[minutes] = layout_text_mask(self.create_text_pixels(text))
+        return text_mask
+
+    def present_frame(self, frame):
+        """Push a composed frame to the canvas in one SetImage call and swap."""
+        # Composed frames are never modified afterwards, so an identical frame can be skipped
+        if self._shown_frame is not None and (
+                frame is self._shown_frame or np.array_equal(frame, self._shown_frame)):
+            return
+        self._shown_frame = frame
+
+        self.controller.canvas.SetImage(Image.fromarray(frame))
+        self.controller.canvas = self._matrix.SwapOnVSync(self.controller.canvas)
+
     def draw_text_pixels(self, text_pixels, start_x, start_y, color):
-        """Draw text pixels on the canvas."""
-        char_x = start_x
-        
-        for char_pixels in text_pixels:
-            for y in range(7):
-                for x in range(5):
-                    if char_pixels[y][x] == 1:
-                        pixel_x = char_x + x
-                        pixel_y = start_y + y
-                        
-                        if 0 <= pixel_x < 64 and 0 <= pixel_y < 32:
-                            self.controller.canvas.SetPixel(
-                                pixel_x, pixel_y,
-                                color[0], color[1], color[2]
-                            )
-            
-            char_x += 6  # Move to next character position
+        """Draw text pixels on the frame."""
+        if not len(text_pixels):
+            return
+        self.draw_text_mask(layout_text_mask(text_pixels), start_x, start_y, color)
+
+    def draw_text_mask(self, text_mask, start_x, start_y, color):
+        """Draw a laid-out 7-row text mask on the frame in one masked assignment."""
+        # Clip the text strip against the 64x32 frame
+        x0, y0 = max(start_x, 0), max(start_y, 0)
+        x1 = min(start_x + text_mask.shape[1], 64)
+        y1 = min(start_y + text_mask.shape[0], 32)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        visible = text_mask[y0 - start_y:y1 - start_y, x0 - start_x:x1 - start_x]
+        self.frame[y0:y1, x0:x1][visible] = color
     
     def display_no_data(self):
         """Display when no arrival data is available."""
-        if hasattr(self.controller, 'canvas') and self.controller.canvas:
-            self.controller.clear()
-            
-            no_data_pixels = self.create_text_pixels("NO DATA")
-            self.draw_text_pixels(no_data_pixels, 10, 12, (255, 0, 0))
-            
-            self.controller.canvas = self.controller.matrix.SwapOnVSync(self.controller.canvas)
+        if self.has_canvas:
+            # The screen never changes, so compose it once; presenting the same frame object
+            # again is skipped without comparing pixels
+            if self._no_data_frame is None:
+                self.frame = np.zeros((32, 64, 3), dtype=np.uint8)
+
+                no_data_pixels = self.create_text_pixels("NO DATA")
+                self.draw_text_pixels(no_data_pixels, 10, 12, (255, 0, 0))
+                self._no_data_frame = self.frame
+
+            self.present_frame(self._no_data_frame)
     
     def run_display(self):
         """Run the continuous MUNI display."""
@@ -223,23 +327,37 @@ class MuniLTaravalDisplay:
         print()
         
         self.running = True
-        
+        self._stop_event.clear()
+        self._fetch_thread = threading.Thread(target=self._fetch_loop, daemon=True)
+        self._fetch_thread.start()
+        deadline = time.monotonic()
+
         try:
             while self.running:
-                print(f"🔄 Updating arrivals... ({datetime.now().strftime('%H:%M:%S')})")
-                self.display_arrivals()
-                
-                # Update every 30 seconds
-                time.sleep(30)
-                
+                now = datetime.now()
+                print(f"🔄 Updating arrivals... ({now.strftime('%H:%M:%S')})")
+                self.display_arrivals(now)
+
+                # Update every 30 seconds on a fixed monotonic schedule so render time doesn't drift it
+                deadline += UPDATE_INTERVAL
+                if self._stop_event.wait(max(0, deadline - time.monotonic())):
+                    break
+
         except KeyboardInterrupt:
             print("\n🛑 MUNI display stopped by user")
         finally:
             self.running = False
+            self._stop_event.set()
+            self._fetch_thread.join(timeout=2)
             self.controller.stop()
             self.controller.clear()
             print("\n🎉 Thanks for using the MUNI L-Taraval display!")
 
+    def stop(self):
+        """Stop the display loop without waiting for the next update."""
+        self.running = False
+        self._stop_event.set()
+
 
 def main():
     """Run the MUNI L-Taraval display."""
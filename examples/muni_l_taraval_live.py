@@ -6,18 +6,338 @@ Shows live arrival times for L-Taraval line on 64x32 RGB matrix.
 
 import sys
 import os
+import math
+import re
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from datetime import datetime, timedelta
 import threading
-import configparser
+import queue
+from functools import lru_cache
+from itertools import accumulate
+from bisect import bisect_right
+import numpy as np
+from PIL import Image
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from matrix.emulator_controller import EmulatorController
 
+# orjson parses the 511.org payload straight from bytes and much faster; fall back to json
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# Simplified 5x7 font for key characters: (width, rows), one bit per column (MSB = left)
+FONT_ROWS = {
+    'L': (5, (0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b11111)),
+    'T': (5, (0b11111, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100)),
+    'A': (5, (0b01110, 0b10001, 0b10001, 0b11111, 0b10001, 0b10001, 0b10001)),
+    'R': (5, (0b11110, 0b10001, 0b10001, 0b11110, 0b10100, 0b10010, 0b10001)),
+    'V': (5, (0b10001, 0b10001, 0b10001, 0b10001, 0b01010, 0b01010, 0b00100)),
+    'E': (5, (0b11111, 0b10000, 0b10000, 0b11110, 0b10000, 0b10000, 0b11111)),
+    'M': (5, (0b10001, 0b11011, 0b10101, 0b10001, 0b10001, 0b10001, 0b10001)),
+    'I': (5, (0b11111, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b11111)),
+    'N': (5, (0b10001, 0b11001, 0b10101, 0b10011, 0b10001, 0b10001, 0b10001)),
+    'U': (5, (0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b01110)),
+    'W': (5, (0b10001, 0b10001, 0b10001, 0b10101, 0b10101, 0b11011, 0b10001)),
+    'O': (5, (0b01110, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b01110)),
+    'C': (5, (0b01110, 0b10001, 0b10000, 0b10000, 0b10000, 0b10001, 0b01110)),
+    'D': (5, (0b11110, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b11110)),
+    'P': (5, (0b11110, 0b10001, 0b10001, 0b11110, 0b10000, 0b10000, 0b10000)),
+    '0': (5, (0b01110, 0b10001, 0b10011, 0b10101, 0b11001, 0b10001, 0b01110)),
+    '1': (5, (0b00100, 0b01100, 0b00100, 0b00100, 0b00100, 0b00100, 0b01110)),
+    '2': (5, (0b01110, 0b10001, 0b00001, 0b00010, 0b00100, 0b01000, 0b11111)),
+    '3': (5, (0b01110, 0b10001, 0b00001, 0b00110, 0b00001, 0b10001, 0b01110)),
+    '4': (5, (0b00010, 0b00110, 0b01010, 0b10010, 0b11111, 0b00010, 0b00010)),
+    '5': (5, (0b11111, 0b10000, 0b11110, 0b00001, 0b00001, 0b10001, 0b01110)),
+    '6': (5, (0b01110, 0b10000, 0b10000, 0b11110, 0b10001, 0b10001, 0b01110)),
+    '7': (5, (0b11111, 0b00001, 0b00010, 0b00100, 0b01000, 0b01000, 0b01000)),
+    '8': (5, (0b01110, 0b10001, 0b10001, 0b01110, 0b10001, 0b10001, 0b01110)),
+    '9': (5, (0b01110, 0b10001, 0b10001, 0b01111, 0b00001, 0b00001, 0b01110)),
+    '-': (2, (0b00, 0b00, 0b00, 0b11, 0b00, 0b00, 0b00)),  # Thin dash (2 pixels wide)
+    ':': (5, (0b00000, 0b00100, 0b00000, 0b00000, 0b00100, 0b00000, 0b00000)),
+    ' ': (2, (0b00, 0b00, 0b00, 0b00, 0b00, 0b00, 0b00)),  # Thinner space (2 pixels wide)
+}
+
+
+def unpack_glyph(width, rows):
+    """Unpack one glyph's row bits into a read-only (7, width) boolean mask."""
+    bits = np.array(rows, dtype=np.uint8)[:, None] >> np.arange(width - 1, -1, -1, dtype=np.uint8)
+    glyph = (bits & 1).astype(bool)
+    glyph.flags.writeable = False  # Shared by every cached text lookup
+    return glyph
+
+
+# Glyph atlas: every font pattern as a boolean mask, built once at import
+GLYPH_ATLAS = {char: unpack_glyph(width, rows) for char, (width, rows) in FONT_ROWS.items()}
+
+# Column width of every glyph, for width math that never touches the masks
+GLYPH_WIDTHS = {char: glyph.shape[1] for char, glyph in GLYPH_ATLAS.items()}
+
+# 1-pixel column placed between characters
+GLYPH_GAP = np.zeros((7, 1), dtype=bool)
+
+# MUNI train car (16x8 pixels) - facing left
+# 0 = empty, 1 = grey body, 2 = red stripe, 3 = black windows
+TRAIN_PATTERN = np.array([
+    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],  # Row 0
+    [0,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0],  # Row 1 - Top of car (grey)
+    [2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0],  # Row 2 - Car body (grey) with red left edge
+    [2,3,1,1,3,3,1,3,3,1,3,3,1,3,3,0],  # Row 3 - Windows (narrow front window, bigger passenger windows)
+    [2,3,1,1,3,3,1,3,3,1,3,3,1,3,3,0],  # Row 4 - Windows (narrow front window, bigger passenger windows)
+    [2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0],  # Row 5 - Red stripe (within car body)
+    [0,1,0,0,1,1,1,1,1,1,1,1,0,0,1,0],  # Row 6 - Bottom with wheels (grey)
+    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],  # Row 7
+], dtype=np.uint8)
+
+# MUNI train colors, indexed by TRAIN_PATTERN value
+TRAIN_PALETTE = np.array([
+    (0, 0, 0),          # Empty (never drawn)
+    (160, 160, 160),    # Light grey for train body
+    (220, 20, 60),      # MUNI red stripe
+    (0, 0, 0),          # Black windows
+], dtype=np.uint8)
+
+# The train as a ready-to-blit RGB sprite and the mask of its drawn (non-empty) pixels
+TRAIN_SPRITE = TRAIN_PALETTE[TRAIN_PATTERN]
+TRAIN_LIT = TRAIN_PATTERN > 0
+
+
+# MUNI Line Color Table (RGB values)
+MUNI_LINE_COLORS = {
+    "L": (128, 0, 128),     # L-Taraval - Purple
+    "N": (0, 100, 200),     # N-Judah - Blue
+    "M": (0, 150, 0),       # M-Ocean View - Green
+    "K": (255, 165, 0),     # K-Ingleside - Orange
+    "J": (255, 255, 0),     # J-Church - Yellow
+    "T": (255, 0, 0),       # T-Third Street - Red
+    "S": (255, 192, 203),   # S-Castro Shuttle - Pink
+    "F": (139, 69, 19),     # F-Market & Wharves - Brown
+    "E": (128, 128, 128),   # E-Embarcadero - Gray
+    "1": (0, 255, 255),     # 1-California - Cyan
+    "2": (255, 20, 147),    # 2-Clement - Deep Pink
+    "3": (50, 205, 50),     # 3-Jackson - Lime Green
+    "5": (255, 140, 0),     # 5-Fulton - Dark Orange
+    "6": (75, 0, 130),      # 6-Haight-Parnassus - Indigo
+    "7": (220, 20, 60),     # 7-Haight-Noriega - Crimson
+    "8": (0, 191, 255),     # 8-Bayshore - Deep Sky Blue
+    "9": (255, 105, 180),   # 9-San Bruno - Hot Pink
+    "10": (34, 139, 34),    # 10-Townsend - Forest Green
+    "12": (255, 69, 0),     # 12-Folsom-Pacific - Red Orange
+    "14": (138, 43, 226),   # 14-Mission - Blue Violet
+    "15": (255, 215, 0),    # 15-Kearny - Gold
+    "19": (72, 61, 139),    # 19-Polk - Dark Slate Blue
+    "22": (255, 99, 71),    # 22-Fillmore - Tomato
+    "24": (147, 112, 219),  # 24-Divisadero - Medium Purple
+    "28": (0, 206, 209),    # 28-19th Avenue - Dark Turquoise
+    "29": (255, 182, 193),  # 29-Sunset - Light Pink
+    "30": (106, 90, 205),   # 30-Stockton - Slate Blue
+    "31": (255, 160, 122),  # 31-Balboa - Light Salmon
+    "33": (64, 224, 208),   # 33-Ashbury-18th St - Turquoise
+    "38": (255, 127, 80),   # 38-Geary - Coral
+    "43": (123, 104, 238),  # 43-Masonic - Medium Slate Blue
+    "44": (240, 230, 140),  # 44-O'Shaughnessy - Khaki
+    "45": (221, 160, 221),  # 45-Union-Stockton - Plum
+    "47": (176, 196, 222),  # 47-Van Ness - Light Steel Blue
+    "49": (205, 92, 92),    # 49-Mission-Van Ness - Indian Red
+}
+
+# Popular L-Taraval stops (real MUNI stop IDs)
+L_TARAVAL_STOPS = {
+    "Embarcadero": "13218",     # Embarcadero Station
+    "Montgomery": "13217",      # Montgomery Station
+    "Powell": "13216",          # Powell Station
+    "Civic Center": "13215",    # Civic Center Station
+    "Van Ness": "13214",        # Van Ness Station
+    "Church": "13213",          # Church Station
+    "Castro": "13212",          # Castro Station
+    "Forest Hill": "13211",     # Forest Hill Station
+    "West Portal": "13210",     # West Portal Station
+    "Sunset Blvd": "13209",     # Sunset Boulevard
+    "19th Ave": "13208",        # 19th Avenue
+    "Taraval/17th": "16615",    # Taraval & 17th Ave
+    "Taraval/17th Ave": "16615", # Alternative name from config
+    "Taraval/46th": "13207",    # Taraval & 46th Ave
+    "SF Zoo": "13206"           # SF Zoo (end of line)
+}
+
+# Stop name for each stop ID, for configs that only give STOP_ID
+STOP_ID_TO_NAME = {stop_id: name for name, stop_id in L_TARAVAL_STOPS.items()}
+
+# Demo arrivals as (destination, minutes, vehicle); only the clock time is filled in per call.
+# Inbound trains go toward downtown, outbound trains toward SF Zoo
+INBOUND_DEMO_ARRIVALS = (
+    ('Embarcadero', 3, 'L1234'),
+    ('Montgomery', 8, 'L5678'),
+    ('Embarcadero', 15, 'L9012'),
+)
+OUTBOUND_DEMO_ARRIVALS = (
+    ('SF Zoo', 3, 'L1234'),
+    ('Taraval/46th', 8, 'L5678'),
+    ('SF Zoo', 15, 'L9012'),
+)
+
+# Fixed colors of the display chrome, shared instead of rebuilt in every render call
+WHITE = (255, 255, 255)
+NO_DATA_YELLOW = (255, 255, 0)
+NO_DATA_RED = (255, 0, 0)
+UPDATE_GREY = (100, 100, 100)
+COUNTDOWN_GREY = (64, 64, 64)
+
+
+def arrival_label(minutes):
+    """Text and urgency color for an arrival this many minutes away."""
+    if minutes == 0:
+        return "NOW", (255, 0, 0)  # Red - immediate/urgent
+    elif minutes == 1:
+        return "1 MIN", (255, 0, 0)  # Red - immediate/urgent
+    elif minutes <= 5:
+        return f"{minutes} MIN", (255, 128, 0)  # Orange - soon
+    else:
+        return f"{minutes} MIN", (0, 255, 0)  # Green - later
+
+
+# Labels for the minute values that actually occur, looked up instead of formatted
+ARRIVAL_LABELS = tuple(arrival_label(minutes) for minutes in range(100))
+
+
+def parse_iso_time(timestamp):
+    """Parse an ISO 8601 timestamp, including the 'Z' UTC suffix 511.org uses."""
+    if timestamp.endswith('Z'):
+        timestamp = timestamp[:-1] + '+00:00'  # Only the suffix is rewritten
+    return datetime.fromisoformat(timestamp)
+
+
+def lerp_x_table(start_x, end_x, steps):
+    """Integer x for each of steps frames from start_x toward end_x, truncated toward zero."""
+    scaled = start_x * steps - (start_x - end_x) * np.arange(steps)
+    return np.where(scaled < 0, -(-scaled // steps), scaled // steps)
+
+
+def clip_to_frame(x, y, width, height):
+    """Clip a width x height block at (x, y) to the 64x32 frame; None if fully off-screen."""
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + width, 64), min(y + height, 32)
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return x0, y0, x1, y1
+
+
+def text_width(text):
+    """Pixel width of text: glyph widths plus a 1-pixel gap between characters."""
+    text = text.upper()
+    blank = GLYPH_WIDTHS[' ']
+    return sum(GLYPH_WIDTHS.get(char, blank) for char in text) + max(len(text) - 1, 0)
+
+
+@lru_cache(maxsize=256)
+def text_to_glyphs(text):
+    """Look up the glyph masks for text; cached because the same strings recur every frame."""
+    blank = GLYPH_ATLAS[' ']
+    return tuple(GLYPH_ATLAS.get(char, blank) for char in text.upper())
+
+
+def layout_glyphs(glyphs):
+    """Lay glyph masks out side by side (character width + 1 space) as one 7-row strip."""
+    if not glyphs:
+        return np.zeros((7, 0), dtype=bool)
+
+    columns = []
+    for char_pixels in glyphs:
+        columns.append(char_pixels)
+        columns.append(GLYPH_GAP)
+    return np.hstack(columns[:-1])
+
+
+def build_towing_sprite(text_strip, text_color):
+    """Compose the train and the text it tows (2px behind) into one RGB sprite and lit mask."""
+    train_height, train_width = TRAIN_PATTERN.shape
+    text_x = train_width + 2
+    sprite = np.zeros((train_height, text_x + text_strip.shape[1], 3), dtype=np.uint8)
+    lit = np.zeros(sprite.shape[:2], dtype=bool)
+
+    lit[:, :train_width] = TRAIN_LIT
+    sprite[:, :train_width] = TRAIN_SPRITE
+    lit[:text_strip.shape[0], text_x:] = text_strip
+    sprite[:text_strip.shape[0], text_x:][text_strip] = text_color
+    return sprite, lit
+
+
+def blit_sprite(target, sprite, lit, x, y):
+    """Blit the lit pixels of a prebuilt RGB sprite into target, clipped to the 64x32 frame."""
+    bounds = clip_to_frame(x, y, sprite.shape[1], sprite.shape[0])
+    if bounds is None:
+        return
+
+    x0, y0, x1, y1 = bounds
+    visible = lit[y0 - y:y1 - y, x0 - x:x1 - x]
+    target[y0:y1, x0:x1][visible] = sprite[y0 - y:y1 - y, x0 - x:x1 - x][visible]
+
+
+@lru_cache(maxsize=64)
+def truncate_text(text, max_width):
+    """Longest prefix of text that fits in max_width pixels."""
+    # Width of every prefix: character widths plus the 1-pixel gap before each extra character
+    blank = GLYPH_WIDTHS[' ']
+    char_widths = (GLYPH_WIDTHS.get(char, blank) + 1 for char in text.upper())
+    prefix_widths = [width - 1 for width in accumulate(char_widths)]
+
+    # Widths only grow, so the longest fitting prefix is found by bisection
+    # (an empty string if even a single character doesn't fit)
+    return text[:bisect_right(prefix_widths, max_width)]
+
+
+@lru_cache(maxsize=64)
+def render_text_strip(text):
+    """Build the laid-out mask for text once; arrival and status strings repeat every frame."""
+    strip = layout_glyphs(text_to_glyphs(text))
+    strip.flags.writeable = False
+    return strip
+
+
+@lru_cache(maxsize=4)
+def render_update_strip(last_update):
+    """Laid-out "UPD HH:MM" mask for an update time; formatted once per distinct time."""
+    return render_text_strip(f"UPD {last_update.strftime('%H:%M')}")
+
+
+# One KEY=value config line; blank lines, comments and lines without '=' don't match
+CONFIG_LINE = re.compile(r'^\s*([^#\s=][^=]*?)\s*=(.*)$')
+
+
+@lru_cache(maxsize=4)
+def parse_config_file(config_file, mtime_ns):
+    """Parse a KEY=value config file into a dict; cached per (path, modification time)."""
+    config = {}
+    with open(config_file, 'r') as f:
+        for line in f:
+            match = CONFIG_LINE.match(line)
+            if match:
+                # Remove quotes from value if present
+                config[match.group(1)] = match.group(2).strip().strip('"').strip("'")
+    return config
+
+
+def read_config_file(config_file):
+    """Config file contents as a dict, re-parsed only when the file has changed on disk."""
+    return parse_config_file(config_file, os.stat(config_file).st_mtime_ns)
+
+
+def get_config(config_file, key, default=None):
+    """Look up one key in a config file, or default when the file or key is missing."""
+    if not os.path.exists(config_file):
+        return default
+    return read_config_file(config_file).get(key, default)
+
 
 class MuniLTaravalDisplay:
     """Real-time MUNI L-Taraval arrival display."""
@@ -53,70 +373,15 @@ class MuniLTaravalDisplay:
             else:
                 self.line_id = config_line[0] if config_line else "L"
 
-        # MUNI Line Color Table (RGB values)
-        self.muni_line_colors = {
-            "L": (128, 0, 128),     # L-Taraval - Purple
-            "N": (0, 100, 200),     # N-Judah - Blue
-            "M": (0, 150, 0),       # M-Ocean View - Green
-            "K": (255, 165, 0),     # K-Ingleside - Orange
-            "J": (255, 255, 0),     # J-Church - Yellow
-            "T": (255, 0, 0),       # T-Third Street - Red
-            "S": (255, 192, 203),   # S-Castro Shuttle - Pink
-            "F": (139, 69, 19),     # F-Market & Wharves - Brown
-            "E": (128, 128, 128),   # E-Embarcadero - Gray
-            "1": (0, 255, 255),     # 1-California - Cyan
-            "2": (255, 20, 147),    # 2-Clement - Deep Pink
-            "3": (50, 205, 50),     # 3-Jackson - Lime Green
-            "5": (255, 140, 0),     # 5-Fulton - Dark Orange
-            "6": (75, 0, 130),      # 6-Haight-Parnassus - Indigo
-            "7": (220, 20, 60),     # 7-Haight-Noriega - Crimson
-            "8": (0, 191, 255),     # 8-Bayshore - Deep Sky Blue
-            "9": (255, 105, 180),   # 9-San Bruno - Hot Pink
-            "10": (34, 139, 34),    # 10-Townsend - Forest Green
-            "12": (255, 69, 0),     # 12-Folsom-Pacific - Red Orange
-            "14": (138, 43, 226),   # 14-Mission - Blue Violet
-            "15": (255, 215, 0),    # 15-Kearny - Gold
-            "19": (72, 61, 139),    # 19-Polk - Dark Slate Blue
-            "22": (255, 99, 71),    # 22-Fillmore - Tomato
-            "24": (147, 112, 219),  # 24-Divisadero - Medium Purple
-            "28": (0, 206, 209),    # 28-19th Avenue - Dark Turquoise
-            "29": (255, 182, 193),  # 29-Sunset - Light Pink
-            "30": (106, 90, 205),   # 30-Stockton - Slate Blue
-            "31": (255, 160, 122),  # 31-Balboa - Light Salmon
-            "33": (64, 224, 208),   # 33-Ashbury-18th St - Turquoise
-            "38": (255, 127, 80),   # 38-Geary - Coral
-            "43": (123, 104, 238),  # 43-Masonic - Medium Slate Blue
-            "44": (240, 230, 140),  # 44-O'Shaughnessy - Khaki
-            "45": (221, 160, 221),  # 45-Union-Stockton - Plum
-            "47": (176, 196, 222),  # 47-Van Ness - Light Steel Blue
-            "49": (205, 92, 92),    # 49-Mission-Van Ness - Indian Red
-        }
-
         # Get the color for the current line
-        self.line_color = self.muni_line_colors.get(self.line_id, (255, 255, 255))  # Default to white
+        self.line_color = MUNI_LINE_COLORS.get(self.line_id, WHITE)  # Default to white
 
         # Popular L-Taraval stops (real MUNI stop IDs)
-        self.stops = {
-            "Embarcadero": "13218",     # Embarcadero Station
-            "Montgomery": "13217",      # Montgomery Station
-            "Powell": "13216",          # Powell Station
-            "Civic Center": "13215",    # Civic Center Station
-            "Van Ness": "13214",        # Van Ness Station
-            "Church": "13213",          # Church Station
-            "Castro": "13212",          # Castro Station
-            "Forest Hill": "13211",     # Forest Hill Station
-            "West Portal": "13210",     # West Portal Station
-            "Sunset Blvd": "13209",     # Sunset Boulevard
-            "19th Ave": "13208",        # 19th Avenue
-            "Taraval/17th": "16615",    # Taraval & 17th Ave
-            "Taraval/17th Ave": "16615", # Alternative name from config
-            "Taraval/46th": "13207",    # Taraval & 46th Ave
-            "SF Zoo": "13206"           # SF Zoo (end of line)
-        }
+        self.stops = L_TARAVAL_STOPS
 
         # Load stop from config file, fallback to default
-        config_stop_name = self.config.get('STOP_NAME', 'Taraval/17th')
         config_stop_id = self.config.get('STOP_ID', '')
+        config_stop_name = self.config.get('STOP_NAME', STOP_ID_TO_NAME.get(config_stop_id, 'Taraval/17th'))
 
         if config_stop_id:
             # Use stop ID directly from config
@@ -130,19 +395,28 @@ class MuniLTaravalDisplay:
         # Load direction from config file, fallback to default
         config_direction = self.config.get('DIRECTION', 'Inbound')
         self.direction = config_direction
-        self.direction_id = 1 if config_direction.lower() == 'inbound' else 0
-        self.direction_display = "I" if config_direction.lower() == 'inbound' else "O"
+        self.inbound = config_direction.lower() == 'inbound'
+        self.direction_id = 1 if self.inbound else 0
+        self.direction_display = "I" if self.inbound else "O"
+        self.demo_arrivals = INBOUND_DEMO_ARRIVALS if self.inbound else OUTBOUND_DEMO_ARRIVALS
+
+        # 511.org reports direction as IB/OB; visits for any other (line, direction) are skipped
+        self.api_direction = "IB" if self.inbound else "OB"
+        self.wanted_route = (self.line_id, self.api_direction)
 
         # Animation state for train towing updates
         self.animation_active = False
         self.animation_frame = 0
         self.animation_total_frames = 120  # Default frames, will be calculated dynamically
         self.animation_phase = "entering"  # "exiting" or "entering"
+        self.animation_tracks = ()  # (start_x, end_x, sprite, lit mask) per moving train
+        self.animation_band = None  # Rows 12-19 of every animation frame, rendered up front
         self.current_arrivals = []  # Track current arrivals to detect changes
+        self.arrivals_signature = ()  # (minutes, destination) of each current arrival
         self.old_arrival_text = ""  # Store old arrival text for exit animation
 
         # Test mode configuration
-        self.test_mode = self.config.get('TEST_MODE', 'false').lower() == 'true'
+        self.test_mode = self._config_flag('TEST_MODE')
         self.test_data = []
         self.test_data_index = 0
         if self.test_mode:
@@ -155,48 +429,96 @@ class MuniLTaravalDisplay:
             self.update_interval = int(self.config.get('UPDATE_INTERVAL', 30))
 
         # Debug mode configuration
-        self.debug_mode = self.config.get('DEBUG_MODE', 'false').lower() == 'true'
+        self.debug_mode = self._config_flag('DEBUG_MODE')
 
         # Track next update time
         self.next_update_time = None
+        self.last_countdown_debug = time.monotonic()  # Last countdown debug trace
+        self.countdown_cache = (None, None, 0)  # (seconds shown, strip, x) for the countdown
         self.last_data_fetch_time = 0  # Track when we last fetched new data
 
         # Persistent display state - what to show until next data update
         self.display_arrival_text = "NO DATA"
-        self.display_arrival_color = (255, 255, 0)  # Default yellow
+        self.display_arrival_color = NO_DATA_YELLOW  # Default yellow
+        self.display_arrival_sprite = None  # Train + arrival text (sprite, lit), built per fetch
 
         # Store old arrival info for exit animation
-        self.old_arrival_color = (255, 255, 0)  # Default yellow
+        self.old_arrival_color = NO_DATA_YELLOW  # Default yellow
+        self.old_arrival_sprite = None
 
-        # Track previous animation positions for selective clearing
-        self.prev_train_x = None
-        self.prev_text_x = None
-        self.prev_text_width = None
+        # The canvas only exists with an emulator or hardware backend; check once
+        self.has_canvas = self.controller.canvas is not None
+
+        # Off-screen 64x32 RGB frame; composed each frame and pushed with one SetImage
+        self.frame = np.zeros((32, 64, 3), dtype=np.uint8)
+        self.shown_frame = None  # Copy of the last frame pushed to the canvas
+        self.static_key = None  # What the last static-mode frame showed
+
+        # Optional gamma correction, applied to the whole frame as one table lookup before SetImage
+        try:
+            gamma = float(self.config.get('GAMMA', 1.0))
+            if not (math.isfinite(gamma) and gamma > 0):
+                raise ValueError("must be a positive finite number")
+        except ValueError as e:
+            print(f"⚠️  Invalid GAMMA value {self.config.get('GAMMA')!r} ({e}), using 1.0")
+            gamma = 1.0
+        self.gamma_lut = None
+        self.output_frame = self.frame
+        if gamma != 1.0:
+            self.gamma_lut = np.round(np.linspace(0, 1, 256) ** gamma * 255).astype(np.uint8)
+            self.output_frame = np.empty_like(self.frame)
+
+        # One PIL image reused for every SetImage; Pillow stores RGB as 4 bytes per pixel,
+        # so it cannot share the ndarray's memory and the pixels are copied in per push
+        self.frame_image = Image.new('RGB', (64, 32))
+
+        # Everything that stays put between data updates, copied in at the start of each frame
+        self.background = self.render_background()
+
+        # Persistent HTTP session so every 511.org poll reuses one keep-alive connection;
+        # short backed-off retries cover the server having closed that connection between
+        # polls (they run on the poller thread, never the render loop)
+        self.session = requests.Session()
+        self.session.headers.update({'Accept-Encoding': 'gzip', 'Accept': 'application/json'})
+        retries = Retry(total=2, backoff_factor=0.3)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Validators from the last full response; unchanged polls come back as 304
+        # and re-time the visits already parsed from that response
+        self.etag = None
+        self.last_modified = None
+        self.cached_visits = None
+
+        # Live data is polled on a background thread so a slow 511.org response never
+        # stalls rendering; the queue holds only the newest (arrivals, fetch time) result
+        self.arrivals_queue = queue.Queue(maxsize=1)
+        self.arrivals_ready = threading.Event()  # Wakes the static-mode wait early
+        self.stop_event = threading.Event()
+        self.poll_thread = None
 
     def _load_config(self, config_file):
         """Load configuration from muni.config file."""
         config = {}
         try:
             if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            key, value = line.split('=', 1)
-                            # Remove quotes from value if present
-                            value = value.strip().strip('"').strip("'")
-                            config[key.strip()] = value
+                config = dict(read_config_file(config_file))
                 print(f"✅ Loaded configuration from {config_file}")
                 print(f"   STOP_NAME: {config.get('STOP_NAME', 'Not set')}")
             else:
                 print(f"⚠️  Config file {config_file} not found, using defaults")
-        except Exception as e:
+        except (OSError, UnicodeDecodeError) as e:
             print(f"⚠️  Error loading config file {config_file}: {e}")
         return config
 
+    def _config_flag(self, key):
+        """Read a true/false config value as a bool (missing means false)."""
+        return self.config.get(key, 'false').lower() == 'true'
+
     def get_line_color(self, line_id):
         """Get the official MUNI color for a given line."""
-        return self.muni_line_colors.get(line_id.upper(), (255, 255, 255))
+        return MUNI_LINE_COLORS.get(line_id.upper(), WHITE)
 
     def get_api_key_instructions(self):
         """Show instructions for getting a 511.org API key."""
@@ -230,24 +552,43 @@ class MuniLTaravalDisplay:
                 print(f"   Stop ID: {self.stop_id}")
                 print(f"   Agency: SF (MUNI)")
 
-            response = requests.get(url, params=params, timeout=10)
+            headers = {}
+            if self.cached_visits is not None:
+                if self.etag:
+                    headers['If-None-Match'] = self.etag
+                if self.last_modified:
+                    headers['If-Modified-Since'] = self.last_modified
+
+            # Fail fast on an unreachable host, but give a slow response time to arrive
+            response = self.session.get(url, params=params, headers=headers, timeout=(3, 10))
             response.raise_for_status()
 
-            # Handle UTF-8 BOM if present
-            response_text = response.text
-            if response_text.startswith('\ufeff'):
-                response_text = response_text[1:]  # Remove BOM
+            if response.status_code == 304:
+                # Nothing changed since the last poll: reuse the parsed visits
+                if self.debug_mode:
+                    print("✅ API response unchanged since last poll (304)")
+                visits = self.cached_visits
+            else:
+                # Decode straight from the raw bytes, dropping the UTF-8 BOM 511.org prepends
+                raw = response.content
+                if raw.startswith(UTF8_BOM):
+                    raw = raw[len(UTF8_BOM):]
 
-            data = json.loads(response_text)
+                data = json_loads(raw)
 
-            if self.debug_mode:
-                print(f"✅ API response received ({len(str(data))} chars)")
-                # Print first level of response structure for debugging
-                if isinstance(data, dict):
-                    print(f"🔍 Response keys: {list(data.keys())}")
+                if self.debug_mode:
+                    print(f"✅ API response received ({len(raw)} bytes)")
+                    # Print first level of response structure for debugging
+                    if isinstance(data, dict):
+                        print(f"🔍 Response keys: {list(data.keys())}")
+
+                # Parse the 511.org API response
+                visits = self.parse_511_visits(data)
+                self.cached_visits = visits
+                self.etag = response.headers.get('ETag')
+                self.last_modified = response.headers.get('Last-Modified')
 
-            # Parse the 511.org API response
-            arrivals = self.parse_511_response(data)
+            arrivals = self.time_arrivals(visits)
 
             if arrivals:
                 if self.debug_mode:
@@ -270,9 +611,9 @@ class MuniLTaravalDisplay:
             print(f"⚠️  Unexpected error: {e} - using demo data")
             return self.get_demo_data()
 
-    def parse_511_response(self, data):
-        """Parse 511.org API response into our internal arrival format."""
-        arrivals = []
+    def parse_511_visits(self, data):
+        """Extract (arrival timestamp, arrival info) pairs for our line and direction."""
+        visits = []
 
         try:
             service_delivery = data.get('ServiceDelivery', {})
@@ -282,7 +623,7 @@ class MuniLTaravalDisplay:
                 if self.debug_mode:
                     print("⚠️  No StopMonitoringDelivery in API response")
                     print(f"🔍 ServiceDelivery keys: {list(service_delivery.keys())}")
-                return arrivals
+                return visits
 
             # Get the first (and usually only) stop monitoring delivery
             delivery = stop_monitoring[0] if isinstance(stop_monitoring, list) else stop_monitoring
@@ -292,7 +633,7 @@ class MuniLTaravalDisplay:
                 if self.debug_mode:
                     print("⚠️  No MonitoredStopVisit in API response")
                     print(f"🔍 Delivery keys: {list(delivery.keys())}")
-                return arrivals
+                return visits
 
             if self.debug_mode:
                 print(f"🔍 Found {len(monitored_calls)} monitored calls")
@@ -300,181 +641,103 @@ class MuniLTaravalDisplay:
             for call in monitored_calls:
                 try:
                     journey = call.get('MonitoredVehicleJourney', {})
-                    line_ref = journey.get('LineRef', '')
-                    direction_ref = journey.get('DirectionRef', '')
+                    route = (journey.get('LineRef', ''), journey.get('DirectionRef', ''))
 
                     # Debug: Show what we're getting vs what we're looking for
                     if self.debug_mode:
-                        print(f"🔍 Found: Line={line_ref}, Direction={direction_ref} (looking for Line={self.line_id}, Direction={self.direction})")
-
-                    # Map direction to API format (Inbound -> IB, Outbound -> OB)
-                    api_direction = "IB" if self.direction.lower() == "inbound" else "OB"
+                        print(f"🔍 Found: Line={route[0]}, Direction={route[1]} (looking for Line={self.line_id}, Direction={self.direction})")
 
-                    # Filter for our specific line and direction
-                    if (line_ref == self.line_id and
-                        direction_ref == api_direction):
+                    # The stop is served by several lines; reject other routes before any further lookups
+                    if route != self.wanted_route:
+                        continue
 
-                        monitored_call = journey.get('MonitoredCall', {})
+                    line_ref, direction_ref = route
+                    monitored_call = journey.get('MonitoredCall', {})
 
-                        # Get arrival time
-                        expected_arrival = monitored_call.get('ExpectedArrivalTime')
-                        aimed_arrival = monitored_call.get('AimedArrivalTime')
+                    # Get arrival time
+                    expected_arrival = monitored_call.get('ExpectedArrivalTime')
+                    aimed_arrival = monitored_call.get('AimedArrivalTime')
 
-                        arrival_time_str = expected_arrival or aimed_arrival
+                    arrival_time_str = expected_arrival or aimed_arrival
 
-                        if arrival_time_str:
-                            # Parse ISO 8601 timestamp
-                            arrival_time = datetime.fromisoformat(arrival_time_str.replace('Z', '+00:00'))
+                    if arrival_time_str:
+                        # Parse ISO 8601 timestamp
+                        arrival_time = parse_iso_time(arrival_time_str)
 
-                            # Convert to local time and calculate minutes
-                            now = datetime.now(arrival_time.tzinfo)
-                            minutes_until = int((arrival_time - now).total_seconds() / 60)
-
-                            if minutes_until >= 0:  # Only future arrivals
-                                arrivals.append({
-                                    'minutes': minutes_until,
-                                    'destination': journey.get('DestinationName', 'Unknown'),
-                                    'vehicle_id': journey.get('VehicleRef', ''),
-                                    'line': line_ref,
-                                    'direction': direction_ref
-                                })
+                        # Kept as epoch seconds so minutes can be recomputed without re-parsing
+                        visits.append((arrival_time.timestamp(), {
+                            'destination': journey.get('DestinationName', 'Unknown'),
+                            'vehicle_id': journey.get('VehicleRef', ''),
+                            'line': line_ref,
+                            'direction': direction_ref
+                        }))
 
                 except Exception as e:
                     if self.debug_mode:
                         print(f"⚠️  Error parsing arrival: {e}")
                     continue
 
-            # Sort by arrival time
-            arrivals.sort(key=lambda x: x['minutes'])
-
-            if self.debug_mode and arrivals:
-                arrival_times = [f"{a['minutes']}min" for a in arrivals[:3]]
-                print(f"📋 Live arrivals: {arrival_times}")
-
         except Exception as e:
             if self.debug_mode:
                 print(f"⚠️  Error parsing 511 response: {e}")
 
+        return visits
+
+    def time_arrivals(self, visits):
+        """Turn parsed visits into upcoming arrivals with minutes from now, soonest first."""
+        # One reference time for the whole response, as epoch seconds
+        now_ts = time.time()
+
+        arrivals = []
+        for arrival_ts, info in visits:
+            minutes_until = int((arrival_ts - now_ts) / 60)
+            if minutes_until >= 0:  # Only future arrivals
+                arrivals.append({'minutes': minutes_until, **info})
+
+        # Sort by arrival time
+        arrivals.sort(key=lambda x: x['minutes'])
+
+        if self.debug_mode and arrivals:
+            arrival_times = [f"{a['minutes']}min" for a in arrivals[:3]]
+            print(f"📋 Live arrivals: {arrival_times}")
+
         return arrivals
 
     def get_demo_data(self):
         """Generate demo arrival data for testing."""
         now = datetime.now()
 
-        # Generate direction-specific destinations
-        if self.direction.lower() == 'inbound':
-            # Inbound trains go toward downtown
-            destinations = ['Embarcadero', 'Montgomery', 'Powell', 'Civic Center']
-        else:
-            # Outbound trains go toward SF Zoo
-            destinations = ['SF Zoo', 'Taraval/46th', 'Sunset Blvd']
-
         demo_arrivals = [
             {
-                'destination': destinations[0],
-                'minutes': 3,
-                'vehicle': 'L1234',
-                'time': (now + timedelta(minutes=3)).strftime('%H:%M')
-            },
-            {
-                'destination': destinations[1] if len(destinations) > 1 else destinations[0],
-                'minutes': 8,
-                'vehicle': 'L5678',
-                'time': (now + timedelta(minutes=8)).strftime('%H:%M')
-            },
-            {
-                'destination': destinations[0],
-                'minutes': 15,
-                'vehicle': 'L9012',
-                'time': (now + timedelta(minutes=15)).strftime('%H:%M')
+                'destination': destination,
+                'minutes': minutes,
+                'vehicle': vehicle,
+                'time': (now + timedelta(minutes=minutes)).strftime('%H:%M')
             }
+            for destination, minutes, vehicle in self.demo_arrivals
         ]
         self.last_update = now
         return demo_arrivals
     
-    def create_text_pixels(self, text):
-        """Create pixel representation of text using simple 5x7 font."""
-        # Simplified font for key characters
-        font_patterns = {
-            'L': [[1,0,0,0,0],[1,0,0,0,0],[1,0,0,0,0],[1,0,0,0,0],[1,0,0,0,0],[1,0,0,0,0],[1,1,1,1,1]],
-            'T': [[1,1,1,1,1],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0]],
-            'A': [[0,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[1,1,1,1,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1]],
-            'R': [[1,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[1,1,1,1,0],[1,0,1,0,0],[1,0,0,1,0],[1,0,0,0,1]],
-            'V': [[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[0,1,0,1,0],[0,1,0,1,0],[0,0,1,0,0]],
-            'E': [[1,1,1,1,1],[1,0,0,0,0],[1,0,0,0,0],[1,1,1,1,0],[1,0,0,0,0],[1,0,0,0,0],[1,1,1,1,1]],
-            'M': [[1,0,0,0,1],[1,1,0,1,1],[1,0,1,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1]],
-            'I': [[1,1,1,1,1],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[1,1,1,1,1]],
-            'N': [[1,0,0,0,1],[1,1,0,0,1],[1,0,1,0,1],[1,0,0,1,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1]],
-            'U': [[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[0,1,1,1,0]],
-            'W': [[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,1,0,1],[1,0,1,0,1],[1,1,0,1,1],[1,0,0,0,1]],
-            'O': [[0,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[0,1,1,1,0]],
-            'C': [[0,1,1,1,0],[1,0,0,0,1],[1,0,0,0,0],[1,0,0,0,0],[1,0,0,0,0],[1,0,0,0,1],[0,1,1,1,0]],
-            'D': [[1,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[1,1,1,1,0]],
-            'P': [[1,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[1,1,1,1,0],[1,0,0,0,0],[1,0,0,0,0],[1,0,0,0,0]],
-            '0': [[0,1,1,1,0],[1,0,0,0,1],[1,0,0,1,1],[1,0,1,0,1],[1,1,0,0,1],[1,0,0,0,1],[0,1,1,1,0]],
-            '1': [[0,0,1,0,0],[0,1,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,1,1,1,0]],
-            '2': [[0,1,1,1,0],[1,0,0,0,1],[0,0,0,0,1],[0,0,0,1,0],[0,0,1,0,0],[0,1,0,0,0],[1,1,1,1,1]],
-            '3': [[0,1,1,1,0],[1,0,0,0,1],[0,0,0,0,1],[0,0,1,1,0],[0,0,0,0,1],[1,0,0,0,1],[0,1,1,1,0]],
-            '4': [[0,0,0,1,0],[0,0,1,1,0],[0,1,0,1,0],[1,0,0,1,0],[1,1,1,1,1],[0,0,0,1,0],[0,0,0,1,0]],
-            '5': [[1,1,1,1,1],[1,0,0,0,0],[1,1,1,1,0],[0,0,0,0,1],[0,0,0,0,1],[1,0,0,0,1],[0,1,1,1,0]],
-            '6': [[0,1,1,1,0],[1,0,0,0,0],[1,0,0,0,0],[1,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[0,1,1,1,0]],
-            '7': [[1,1,1,1,1],[0,0,0,0,1],[0,0,0,1,0],[0,0,1,0,0],[0,1,0,0,0],[0,1,0,0,0],[0,1,0,0,0]],
-            '8': [[0,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[0,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[0,1,1,1,0]],
-            '9': [[0,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[0,1,1,1,1],[0,0,0,0,1],[0,0,0,0,1],[0,1,1,1,0]],
-            '-': [[0,0],[0,0],[0,0],[1,1],[0,0],[0,0],[0,0]],  # Thin dash (2 pixels wide)
-            ':': [[0,0,0,0,0],[0,0,1,0,0],[0,0,0,0,0],[0,0,0,0,0],[0,0,1,0,0],[0,0,0,0,0],[0,0,0,0,0]],
-            ' ': [[0,0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,0]]  # Thinner space (2 pixels wide)
-        }
-        
-        text_pixels = []
-        for char in text.upper():
-            if char in font_patterns:
-                text_pixels.append(font_patterns[char])
-            else:
-                text_pixels.append(font_patterns[' '])
-        
-        return text_pixels
-
-    def get_text_width(self, text_pixels):
-        """Calculate the total width of text including variable-width characters."""
-        total_width = 0
-        for i, char_pixels in enumerate(text_pixels):
-            char_width = len(char_pixels[0])
-            total_width += char_width
-            if i < len(text_pixels) - 1:  # Add space between characters (except last)
-                total_width += 1
-        return total_width
-
     def truncate_text_to_fit(self, text, max_width):
         """Truncate text to fit within the specified width."""
-        # Try the full text first
-        full_pixels = self.create_text_pixels(text)
-        if self.get_text_width(full_pixels) <= max_width:
-            return text
-
-        # If it doesn't fit, try progressively shorter versions
-        for i in range(len(text) - 1, 0, -1):
-            truncated = text[:i]
-            truncated_pixels = self.create_text_pixels(truncated)
-            if self.get_text_width(truncated_pixels) <= max_width:
-                return truncated
-
-        # If even a single character doesn't fit, return empty string
-        return ""
+        return truncate_text(text, max_width)
 
     def load_test_data(self):
         """Load test data from muni_test.txt file."""
         test_file = os.path.join(os.path.dirname(__file__), 'muni_test.txt')
         try:
-            with open(test_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        try:
-                            data = json.loads(line)
-                            self.test_data.append(data)
-                        except json.JSONDecodeError as e:
-                            print(f"⚠️  Invalid JSON in test data: {line[:50]}...")
+            # Read the file in one go as bytes; json_loads parses each line without decoding it first
+            with open(test_file, 'rb') as f:
+                lines = f.read().splitlines()
+            for line in lines:
+                line = line.strip()
+                if line and not line.startswith(b'#'):
+                    try:
+                        data = json_loads(line)
+                        self.test_data.append(self.parse_test_visits(data))
+                    except json.JSONDecodeError:
+                        print(f"⚠️  Invalid JSON in test data: {line[:50].decode('utf-8', 'replace')}...")
             print(f"📋 Loaded {len(self.test_data)} test data entries")
         except FileNotFoundError:
             print(f"❌ Test file not found: {test_file}")
@@ -484,23 +747,9 @@ class MuniLTaravalDisplay:
             print(f"❌ Error loading test data: {e}")
             self.test_mode = False
 
-    def get_test_data(self):
-        """Get next test data entry and convert to arrival format."""
-        if not self.test_data:
-            print("❌ No test data available")
-            return []
-
-        # Get current test data entry
-        test_entry = self.test_data[self.test_data_index]
-        current_index = self.test_data_index + 1  # Display 1-based index
-
-        print(f"📋 Using test data entry {current_index}/{len(self.test_data)}")
-
-        # Advance to next entry for next time
-        self.test_data_index = (self.test_data_index + 1) % len(self.test_data)
-
-        # Convert 511 API format to our internal format
-        arrivals = []
+    def parse_test_visits(self, test_entry):
+        """Parse a test entry once into (arrival timestamp, destination) pairs; None if malformed."""
+        visits = []
         try:
             service_delivery = test_entry.get('ServiceDelivery', {})
             stop_monitoring = service_delivery.get('StopMonitoringDelivery', [])
@@ -514,54 +763,67 @@ class MuniLTaravalDisplay:
 
                     if 'ExpectedArrivalTime' in call:
                         arrival_time_str = call['ExpectedArrivalTime']
-                        arrival_time = datetime.fromisoformat(arrival_time_str.replace('Z', '+00:00'))
-                        now = datetime.now(arrival_time.tzinfo)
-
-                        minutes = max(0, int((arrival_time - now).total_seconds() / 60))
+                        arrival_time = parse_iso_time(arrival_time_str)
                         destination = journey.get('DestinationName', 'Unknown')
 
-                        arrivals.append({
-                            'minutes': minutes,
-                            'destination': destination
-                        })
+                        visits.append((arrival_time.timestamp(), destination))
 
         except Exception as e:
             print(f"❌ Error parsing test data: {e}")
+            return None
+
+        return visits
+
+    def get_test_data(self):
+        """Get next test data entry and convert to arrival format."""
+        if not self.test_data:
+            print("❌ No test data available")
             return []
 
-        return arrivals
+        # Get current test data entry
+        test_entry = self.test_data[self.test_data_index]
+        current_index = self.test_data_index + 1  # Display 1-based index
+
+        print(f"📋 Using test data entry {current_index}/{len(self.test_data)}")
+
+        # Advance to next entry for next time
+        self.test_data_index = (self.test_data_index + 1) % len(self.test_data)
+
+        # Entries were parsed at load time; only the minutes depend on the current time
+        if test_entry is None:
+            return []
+
+        now_ts = time.time()
+        return [
+            {'minutes': max(0, int((arrival_ts - now_ts) / 60)), 'destination': destination}
+            for arrival_ts, destination in test_entry
+        ]
 
     def get_arrival_text_and_color(self):
         """Get the current arrival text and appropriate color."""
         if not self.current_arrivals or len(self.current_arrivals) == 0:
-            return "NO DATA", (255, 255, 0)
+            return "NO DATA", NO_DATA_YELLOW
 
         minutes = self.current_arrivals[0]['minutes']
-        if minutes == 0:
-            return "NOW", (255, 0, 0)  # Red - immediate/urgent
-        elif minutes == 1:
-            return "1 MIN", (255, 0, 0)  # Red - immediate/urgent
-        elif minutes <= 5:
-            return f"{minutes} MIN", (255, 128, 0)  # Orange - soon
-        else:
-            return f"{minutes} MIN", (0, 255, 0)  # Green - later
+        if 0 <= minutes < len(ARRIVAL_LABELS):
+            return ARRIVAL_LABELS[minutes]
+        return arrival_label(minutes)
 
     def start_update_animation(self, is_initial_load=False):
         """Start the train animation for bringing in new arrival data."""
         # Calculate required animation frames based on text lengths
         old_text_length = 0
-        if hasattr(self, 'old_arrival_text') and self.old_arrival_text:
-            old_text_pixels = self.create_text_pixels(self.old_arrival_text)
-            old_text_length = self.get_text_width(old_text_pixels)
-            print(f"🔍 Old text: '{self.old_arrival_text}' width: {old_text_length}px")
+        if self.old_arrival_text:
+            old_text_length = text_width(self.old_arrival_text)
 
-        new_text_pixels = self.create_text_pixels(self.display_arrival_text)
-        new_text_length = self.get_text_width(new_text_pixels)
-        print(f"🔍 New text: '{self.display_arrival_text}' width: {new_text_length}px")
+        new_text_length = text_width(self.display_arrival_text)
 
         # Calculate frames needed to ensure complete text clearance
         self.animation_total_frames = self.calculate_animation_frames(old_text_length, new_text_length)
-        print(f"🔍 Calculated frames: {self.animation_total_frames} (old_len={old_text_length}, new_len={new_text_length})")
+        if self.debug_mode:
+            print(f"🔍 Old text: '{self.old_arrival_text}' width: {old_text_length}px")
+            print(f"🔍 New text: '{self.display_arrival_text}' width: {new_text_length}px")
+            print(f"🔍 Calculated frames: {self.animation_total_frames} (old_len={old_text_length}, new_len={new_text_length})")
 
         self.animation_active = True
         self.animation_frame = 0
@@ -571,79 +833,41 @@ class MuniLTaravalDisplay:
             print(f"🎬 Animation duration: {self.animation_total_frames} frames ({self.animation_total_frames/20:.1f}s)")
 
         # If there's already a train parked (not initial load), start with exit animation
-        if not is_initial_load and hasattr(self, 'old_arrival_text') and self.old_arrival_text:
+        if not is_initial_load and self.old_arrival_text:
             self.animation_phase = "exiting"
             print("🚂 Train animation started - old train exiting, new train incoming!")
         else:
             self.animation_phase = "entering"
             print("🚂 Train animation started - towing next arrival time!")
 
+        # Fix every train's path and prebuild its train + text sprite for the whole animation,
+        # so each frame only interpolates positions and does one blit per train
+        new_track = (64 + 16 + 2 + new_text_length, 1,  # Enter from off-screen right, park at x=1
+                     *self.display_arrival_sprite)
+        if self.animation_phase == "exiting":
+            old_end_x = -(16 + 2 + old_text_length + 5)  # Exit train + gap + text, with buffer
+            old_track = (1, old_end_x, *self.old_arrival_sprite)
+            self.animation_tracks = (old_track, new_track)
+        else:
+            self.animation_tracks = (new_track,)
+
+        self.animation_band = self.render_animation_band()
+
     def draw_train_image(self, x, y):
         """Draw a pixel art MUNI train car facing left with classic grey/red colors."""
-        # MUNI train car (16x8 pixels) - facing left
-        # 0 = empty, 1 = grey body, 2 = red stripe, 3 = black windows
-        train_pattern = [
-            [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],  # Row 0
-            [0,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0],  # Row 1 - Top of car (grey)
-            [2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0],  # Row 2 - Car body (grey) with red left edge
-            [2,3,1,1,3,3,1,3,3,1,3,3,1,3,3,0],  # Row 3 - Windows (narrow front window, bigger passenger windows)
-            [2,3,1,1,3,3,1,3,3,1,3,3,1,3,3,0],  # Row 4 - Windows (narrow front window, bigger passenger windows)
-            [2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0],  # Row 5 - Red stripe (within car body)
-            [0,1,0,0,1,1,1,1,1,1,1,1,0,0,1,0],  # Row 6 - Bottom with wheels (grey)
-            [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],  # Row 7
-        ]
+        blit_sprite(self.frame, TRAIN_SPRITE, TRAIN_LIT, x, y)
+
+    def render_animation_band(self):
+        """Render the trains' 8-row band for every frame of the animation that's starting."""
+        total_frames = self.animation_total_frames
+        band = np.zeros((total_frames, TRAIN_PATTERN.shape[0], 64, 3), dtype=np.uint8)
 
-        # MUNI colors
-        grey_color = (160, 160, 160)    # Light grey for train body
-        red_color = (220, 20, 60)       # MUNI red stripe
-        black_color = (0, 0, 0)         # Black windows
-
-        # Draw the train with appropriate colors
-        for row in range(len(train_pattern)):
-            for col in range(len(train_pattern[row])):
-                pixel_value = train_pattern[row][col]
-                if pixel_value > 0:
-                    pixel_x = x + col
-                    pixel_y = y + row
-                    if 0 <= pixel_x < 64 and 0 <= pixel_y < 32:
-                        if pixel_value == 1:  # Grey body
-                            color = grey_color
-                        elif pixel_value == 2:  # Red stripe
-                            color = red_color
-                        elif pixel_value == 3:  # Black windows
-                            color = black_color
-
-                        self.controller.canvas.SetPixel(
-                            pixel_x, pixel_y,
-                            color[0], color[1], color[2]
-                        )
-
-    def clear_animation_area(self):
-        """Selectively clear only the animation area and countdown timer to reduce flashing."""
-        if hasattr(self.controller, 'canvas') and self.controller.canvas:
-            # Clear the animation strip (where train and text move)
-            animation_y_start = 12  # Start of animation area
-            animation_y_end = 20    # End of animation area (train is 8 pixels tall)
-
-            for y in range(animation_y_start, animation_y_end):
-                for x in range(64):  # Full width
-                    self.controller.canvas.SetPixel(x, y, 0, 0, 0)  # Set to black
-
-            # Also clear the countdown timer area (bottom right)
-            # Countdown is at y=25, and text is 7 pixels tall
-            countdown_y_start = 25
-            countdown_y_end = 32    # Bottom of display
-
-            for y in range(countdown_y_start, countdown_y_end):
-                for x in range(64):  # Full width to clear any previous countdown text
-                    self.controller.canvas.SetPixel(x, y, 0, 0, 0)  # Set to black
-
-    def redraw_static_elements(self):
-        """Redraw static elements that might overlap with the animation area."""
-        # The animation area is y=12-20, so we need to redraw any static elements in that range
-        # In our case, the header and direction are at y=2, and countdown is at y=25+
-        # So no static elements overlap with the animation area - this method can be empty for now
-        pass
+        # Old train exits while the new one enters (or just enters on initial load),
+        # each towing its text 2px behind; anything off-screen is clipped when drawn
+        for start_x, end_x, sprite, lit in self.animation_tracks:
+            for band_frame, x in zip(band, lerp_x_table(start_x, end_x, total_frames).tolist()):
+                blit_sprite(band_frame, sprite, lit, x, 0)
+        return band
 
     def calculate_animation_frames(self, old_text_length, new_text_length):
         """Calculate the number of frames needed for complete animation."""
@@ -668,83 +892,20 @@ class MuniLTaravalDisplay:
         max_distance = max(old_exit_distance, new_enter_distance)
         frames_needed = int(max_distance * 1) + 1  # 1 frame per pixel + 1 to ensure completion
 
-        print(f"🔍 Animation calc: old_exit={old_exit_distance}px, new_enter={new_enter_distance}px, max={max_distance}px, frames={frames_needed}")
+        if self.debug_mode:
+            print(f"🔍 Animation calc: old_exit={old_exit_distance}px, new_enter={new_enter_distance}px, max={max_distance}px, frames={frames_needed}")
         return frames_needed
 
     def draw_animated_train_update(self):
         """Draw the animated train towing arrival times across the screen."""
-        text_y = 12      # Text position
-        train_y = text_y  # Train aligned with text
-
-        # Calculate the effective length of train + text for proper spacing
-        has_old_train = hasattr(self, 'old_arrival_text') and self.old_arrival_text
-
-        if has_old_train:
-            # Calculate old train + text length
-            old_text_pixels = self.create_text_pixels(self.old_arrival_text)
-            old_text_width = self.get_text_width(old_text_pixels)
-            old_total_length = 16 + 2 + old_text_width  # train + gap + text
-        else:
-            old_total_length = 16  # Just train width
-
-        # Calculate new train + text length
-        new_text_pixels = self.create_text_pixels(self.display_arrival_text)
-        new_text_width = self.get_text_width(new_text_pixels)
-        new_total_length = 16 + 2 + new_text_width  # train + gap + text
-
-
-
-        if self.animation_phase == "exiting":
-            # Simple simultaneous animation: old train exits, new train enters
-            progress = self.animation_frame / self.animation_total_frames
+        train_y = 12  # Train and its towed text share the animation row
 
-            # Old train exits from x=1 to completely off-screen
-            old_start_x = 1
-            old_end_x = -(old_total_length + 5)  # Exit with buffer
-            old_train_x = int(old_start_x - ((old_start_x - old_end_x) * progress))
-
-            # New train enters from off-screen to x=1
-            new_start_x = 64 + new_total_length  # Start completely off-screen right
-            new_end_x = 1  # End at parked position
-            new_train_x = int(new_start_x - ((new_start_x - new_end_x) * progress))
-
-            # Draw old train if still visible
-            if old_train_x > -20:
-                self.draw_train_image(old_train_x, train_y)
-
-            # Draw old arrival text
-            old_text_x = old_train_x + 18
-            if old_text_x > -(old_text_width + 5):
-                self.draw_text_pixels(old_text_pixels, old_text_x, text_y, self.old_arrival_color)
-
-            # Draw new train if visible
-            if new_train_x < 64:
-                self.draw_train_image(new_train_x, train_y)
-
-            # Draw new arrival text
-            new_text_x = new_train_x + 18
-            if new_text_x < 64 and new_train_x < 80:
-                self.draw_text_pixels(new_text_pixels, new_text_x, text_y, self.display_arrival_color)
-
-        elif self.animation_phase == "entering":
-            # Single train animation for initial load
-            enter_progress = self.animation_frame / self.animation_total_frames
-            enter_start_x = 64 + new_total_length  # Start completely off-screen right
-            enter_end_x = 1     # End at left edge
-            new_train_x = int(enter_start_x - ((enter_start_x - enter_end_x) * enter_progress))
-
-            # Draw new train if visible
-            if new_train_x < 64:
-                self.draw_train_image(new_train_x, train_y)
-
-            # Draw new arrival text being towed
-            new_text_x = new_train_x + 18  # Position text behind the train
-            if new_text_x < 64 and new_train_x < 80:  # Only show text when train is partially visible
-                self.draw_text_pixels(new_text_pixels, new_text_x, text_y, self.display_arrival_color)
+        # The trains' band was rendered for every frame when the animation started
+        self.frame[train_y:train_y + TRAIN_PATTERN.shape[0]] = self.animation_band[self.animation_frame]
 
         # Advance animation
         self.animation_frame += 1
-        if self.animation_frame % 20 == 0:  # Debug every 20 frames
+        if self.debug_mode and self.animation_frame % 20 == 0:  # Debug every 20 frames
             print(f"🎬 Animation {self.animation_phase} frame {self.animation_frame}/{self.animation_total_frames}")
 
         # Handle animation completion (no more phase transitions)
@@ -758,35 +919,69 @@ class MuniLTaravalDisplay:
             if self.current_arrivals and len(self.current_arrivals) > 0:
                 self.old_arrival_text = self.display_arrival_text
                 self.old_arrival_color = self.display_arrival_color
+                self.old_arrival_sprite = self.display_arrival_sprite
 
             print("🚂 Train animation completed!")
             if self.debug_mode:
                 print("🖼️  Switching to STATIC MODE (5s updates)")
 
+    def fetch_arrivals(self):
+        """Fetch arrivals from the configured source (test file or 511.org)."""
+        return self.get_test_data() if self.test_mode else self.get_live_data()
+
+    def poll_live_data(self):
+        """Fetch data every update interval on a background thread until stopped."""
+        while not self.stop_event.is_set():
+            arrivals = self.fetch_arrivals()
+            fetched_at = time.monotonic()
+
+            # Replace any result the render loop hasn't picked up yet
+            try:
+                self.arrivals_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.arrivals_queue.put((arrivals, fetched_at))
+            self.arrivals_ready.set()
+
+            self.stop_event.wait(self.update_interval)
+
+    def take_fresh_arrivals(self, current_time):
+        """Return (arrivals, fetch time) when new data is ready to show, otherwise None."""
+        if self.animation_active:
+            return None  # Don't swap data mid-animation
+
+        if self.poll_thread is not None:
+            try:
+                return self.arrivals_queue.get_nowait()
+            except queue.Empty:
+                return None
+
+        # No poller (display driven without run_display): fetch inline on the configured interval
+        if (self.last_data_fetch_time == 0 or  # Initial load
+                current_time - self.last_data_fetch_time >= self.update_interval):  # Interval elapsed
+            arrivals = self.fetch_arrivals()
+            return arrivals, current_time
+        return None
+
     def display_arrivals(self):
         """Display arrival information on the matrix."""
-        current_time = time.time()
-
-        # Check if it's time to fetch new data (based on configured interval)
-        should_fetch_data = (
-            not self.animation_active and  # Don't fetch during animation
-            (self.last_data_fetch_time == 0 or  # Initial load
-             current_time - self.last_data_fetch_time >= self.update_interval)  # Interval elapsed
-        )
-
-        if should_fetch_data:
-            if self.test_mode:
-                arrivals = self.get_test_data()
-            else:
-                arrivals = self.get_live_data()  # Now using live 511.org API data!
+        current_time = time.monotonic()
+
+        fresh = self.take_fresh_arrivals(current_time)
+
+        if fresh is not None:
+            arrivals, fetched_at = fresh
 
             # Check if this is new data (different from current) or initial load
-            is_new_data = arrivals != self.current_arrivals
+            # Only minutes and destination matter to the display; compare just those
+            signature = tuple((arrival['minutes'], arrival.get('destination')) for arrival in arrivals)
+            is_new_data = signature != self.arrivals_signature
             is_initial_load = len(self.current_arrivals) == 0
 
             # Update current arrivals and timing
             self.current_arrivals = arrivals
-            self.last_data_fetch_time = current_time
+            self.arrivals_signature = signature
+            self.last_data_fetch_time = fetched_at
 
             # Update persistent display state with new data
             if arrivals and len(arrivals) > 0:
@@ -795,12 +990,16 @@ class MuniLTaravalDisplay:
                     print(f"📱 Display updated: {self.display_arrival_text}")
             else:
                 self.display_arrival_text = "NO DATA"
-                self.display_arrival_color = (255, 255, 0)
+                self.display_arrival_color = NO_DATA_YELLOW
                 if self.debug_mode:
                     print(f"📱 Display updated: NO DATA")
 
+            # The towed text only changes here, so build its sprite once per fetch
+            self.display_arrival_sprite = build_towing_sprite(render_text_strip(self.display_arrival_text),
+                                                              self.display_arrival_color)
+
             # ALWAYS set next update time when we fetch data (respects update_interval)
-            self.next_update_time = current_time + self.update_interval
+            self.next_update_time = fetched_at + self.update_interval
             if self.debug_mode:
                 print(f"📊 Data fetched at {time.strftime('%H:%M:%S')}, next fetch in {self.update_interval}s")
                 print(f"📊 New data: {is_new_data}, Initial load: {is_initial_load}")
@@ -819,122 +1018,150 @@ class MuniLTaravalDisplay:
             self.start_update_animation(is_initial_load=is_initial_load)
         
         # Display format: "L-TARAVAL  3min  8min  15min"
-        if hasattr(self.controller, 'canvas') and self.controller.canvas:
-            # Use selective clearing during animation to reduce flashing
+        if self.has_canvas:
+            # Static frames only change with the shown arrival, update time or countdown text;
+            # skip composing one that would be identical to the frame already on the panel
             if self.animation_active:
-                # Only clear the animation area during animation
-                self.clear_animation_area()
-                # Redraw static elements that might be in the animation area
-                self.redraw_static_elements()
+                self.static_key = None
             else:
-                # Full clear when not animating (less frequent)
-                self.controller.clear()
-            
-            # Direction indicator in top right (with 1 pixel margin from edge)
-            direction_pixels = self.create_text_pixels(self.direction_display)
-            direction_width = self.get_text_width(direction_pixels)
-            direction_x = 64 - direction_width - 1
-            self.draw_text_pixels(direction_pixels, direction_x, 2, (255, 255, 255))
-
-            # Header: Line name in official MUNI line color
-            # Calculate available space for header (leave 2 pixels gap between header and direction)
-            available_width = direction_x - 1 - 2  # Start at x=1, leave 2px gap before direction
-            header_text = self.truncate_text_to_fit(self.line_name, available_width)
-            header_pixels = self.create_text_pixels(header_text)
-            self.draw_text_pixels(header_pixels, 1, 2, self.line_color)
-
-            # Arrival times are shown via animation only
-            # No static display - users see arrival info when train delivers it
-            
-            # Handle train animation or static display
-            if self.animation_active:
-                self.draw_animated_train_update()
-            else:
-                # Static mode: Show train parked on left with arrival information
-                if self.display_arrival_text != "NO DATA":
-                    # Draw train parked at left edge (same position as end of animation)
-                    train_x = 1  # Parked position
-                    train_y = 12  # Same y position as during animation
-                    self.draw_train_image(train_x, train_y)
-
-                    # Draw arrival time next to the parked train (same positioning as animation)
-                    arrival_pixels = self.create_text_pixels(self.display_arrival_text)
-                    text_x = train_x + 18  # Position text behind train (same as animation: train + 2px gap)
-                    text_y = train_y  # Same y position as train
-
-                    self.draw_text_pixels(arrival_pixels, text_x, text_y, self.display_arrival_color)
-
-                # Update timestamp at bottom left
-                if self.last_update:
-                    update_text = f"UPD {self.last_update.strftime('%H:%M')}"
-                    update_pixels = self.create_text_pixels(update_text)
-                    self.draw_text_pixels(update_pixels, 1, 25, (100, 100, 100))
-
-            # Always draw countdown timer at bottom right
-            self.draw_countdown_timer()
-
-            self.controller.canvas = self.controller.matrix.SwapOnVSync(self.controller.canvas)
-    
-    def draw_text_pixels(self, text_pixels, start_x, start_y, color):
-        """Draw text pixels on the canvas."""
-        char_x = start_x
-
-        for char_pixels in text_pixels:
-            char_width = len(char_pixels[0])  # Get actual width of this character
-            for y in range(7):
-                for x in range(char_width):
-                    if char_pixels[y][x] == 1:
-                        pixel_x = char_x + x
-                        pixel_y = start_y + y
-
-                        if 0 <= pixel_x < 64 and 0 <= pixel_y < 32:
-                            self.controller.canvas.SetPixel(
-                                pixel_x, pixel_y,
-                                color[0], color[1], color[2]
-                            )
-
-            char_x += char_width + 1  # Move to next character position (character width + 1 space)
-    
+                static_key = (self.display_arrival_text, self.display_arrival_color,
+                              self.last_update, self.get_countdown_seconds(time.monotonic()))
+                if static_key == self.static_key:
+                    return
+                self.static_key = static_key
+
+            self.compose_frame()
+            self.present_frame()
+
+    def compose_frame(self):
+        """Compose the whole arrivals screen into self.frame in one pass."""
+        # Start every frame from the prerendered header and direction indicator. Mid-animation
+        # the header is still in place and the band overwrites rows 12-19 whole, so only the
+        # countdown rows need restoring
+        if self.animation_active and self.animation_frame > 0:
+            np.copyto(self.frame[25:], self.background[25:])
+        else:
+            np.copyto(self.frame, self.background)
+
+        # Arrival times are shown via animation only
+        # No static display - users see arrival info when train delivers it
+
+        # Handle train animation or static display
+        if self.animation_active:
+            self.draw_animated_train_update()
+        else:
+            # Static mode: Show train parked on left with arrival information
+            if self.display_arrival_text != "NO DATA":
+                # Draw train parked at left edge (same position as end of animation)
+                train_x = 1  # Parked position
+                train_y = 12  # Same y position as during animation
+                self.draw_train_image(train_x, train_y)
+
+                # Draw arrival time next to the parked train (same positioning as animation)
+                text_x = train_x + 18  # Position text behind train (same as animation: train + 2px gap)
+                text_y = train_y  # Same y position as train
+
+                self.draw_text_strip(render_text_strip(self.display_arrival_text), text_x, text_y, self.display_arrival_color)
+
+            # Update timestamp at bottom left
+            if self.last_update:
+                self.draw_text_strip(render_update_strip(self.last_update), 1, 25, UPDATE_GREY)
+
+        # Always draw countdown timer at bottom right
+        self.draw_countdown_timer()
+
+    def render_background(self):
+        """Render the header and direction indicator, which never change while running."""
+        self.frame[:] = 0
+
+        # Direction indicator in top right (with 1 pixel margin from edge)
+        direction_strip = render_text_strip(self.direction_display)
+        direction_x = 64 - direction_strip.shape[1] - 1
+        self.draw_text_strip(direction_strip, direction_x, 2, WHITE)
+
+        # Header: Line name in official MUNI line color
+        # Calculate available space for header (leave 2 pixels gap between header and direction)
+        available_width = direction_x - 1 - 2  # Start at x=1, leave 2px gap before direction
+        header_text = self.truncate_text_to_fit(self.line_name, available_width)
+        self.draw_text_strip(render_text_strip(header_text), 1, 2, self.line_color)
+
+        return self.frame.copy()
+
+    def draw_text_strip(self, text_mask, start_x, start_y, color):
+        """Blit a laid-out text mask onto the frame in one masked assignment."""
+        bounds = clip_to_frame(start_x, start_y, text_mask.shape[1], text_mask.shape[0])
+        if bounds is None:
+            return
+
+        x0, y0, x1, y1 = bounds
+        visible = text_mask[y0 - start_y:y1 - start_y, x0 - start_x:x1 - start_x]
+        self.frame[y0:y1, x0:x1][visible] = color
+
+    def present_frame(self):
+        """Push the composed frame to the canvas in one SetImage call and swap."""
+        # Between updates most frames are redrawn identically; leave the panel as it is
+        if self.shown_frame is not None and np.array_equal(self.frame, self.shown_frame):
+            return
+        self.shown_frame = self.frame.copy()
+
+        if self.gamma_lut is not None:
+            np.take(self.gamma_lut, self.frame, out=self.output_frame)
+        self.frame_image.frombytes(self.output_frame)
+        self.controller.canvas.SetImage(self.frame_image)
+        self.controller.canvas = self.controller.matrix.SwapOnVSync(self.controller.canvas)
+
     def display_no_data(self):
         """Display when no arrival data is available."""
-        if hasattr(self.controller, 'canvas') and self.controller.canvas:
-            self.controller.clear()
-            
-            no_data_pixels = self.create_text_pixels("NO DATA")
-            self.draw_text_pixels(no_data_pixels, 10, 12, (255, 0, 0))
-            
-            self.controller.canvas = self.controller.matrix.SwapOnVSync(self.controller.canvas)
+        if self.has_canvas:
+            # The NO DATA screen never changes; only compose it when something else was shown
+            if self.static_key == "NO DATA":
+                return
+            self.static_key = "NO DATA"  # Also forces the arrivals screen to be recomposed later
+            self.frame[:] = 0
 
-    def draw_countdown_timer(self):
-        """Draw countdown timer showing time to next update."""
+            self.draw_text_strip(render_text_strip("NO DATA"), 10, 12, NO_DATA_RED)
+
+            self.present_frame()
+
+    def get_countdown_seconds(self, current_time):
+        """Whole seconds until the next data update, or None before the first fetch."""
         if self.next_update_time is None:
-            return
+            return None
+        return max(0, int(self.next_update_time - current_time))
 
-        current_time = time.time()
-        seconds_remaining = max(0, int(self.next_update_time - current_time))
+    def get_countdown_text(self, current_time):
+        """Countdown text for the next data update, or None before the first fetch."""
+        seconds_remaining = self.get_countdown_seconds(current_time)
+        if seconds_remaining is None:
+            return None
 
         if seconds_remaining > 0:
-            countdown_text = f"UPD {seconds_remaining}s"
-        else:
-            countdown_text = "UPD NOW"
+            return f"UPD {seconds_remaining}s"
+        return "UPD NOW"
 
-        # Debug output every 10 seconds for countdown
-        if hasattr(self, '_last_countdown_debug'):
-            if current_time - self._last_countdown_debug > 10:
-                print(f"⏰ Countdown: {countdown_text} (next update in {seconds_remaining}s)")
-                self._last_countdown_debug = current_time
-        else:
-            self._last_countdown_debug = current_time
+    def draw_countdown_timer(self):
+        """Draw countdown timer showing time to next update."""
+        current_time = time.monotonic()
+        seconds_remaining = self.get_countdown_seconds(current_time)
+        if seconds_remaining is None:
+            return
+
+        # The countdown only changes once a second; rebuild its strip on that boundary
+        if seconds_remaining != self.countdown_cache[0]:
+            countdown_strip = render_text_strip(self.get_countdown_text(current_time))
+            x_pos = 64 - countdown_strip.shape[1] - 1  # Right-aligned with 1-pixel margin
+            self.countdown_cache = (seconds_remaining, countdown_strip, x_pos)
 
-        # Draw countdown in grey at bottom right
-        countdown_pixels = self.create_text_pixels(countdown_text)
-        text_width = self.get_text_width(countdown_pixels)
-        x_pos = 64 - text_width - 1  # Right-aligned with 1-pixel margin
+            # Debug output every 10 seconds for countdown
+            if self.debug_mode and current_time - self.last_countdown_debug > 10:
+                print(f"⏰ Countdown: {self.get_countdown_text(current_time)}")
+                self.last_countdown_debug = current_time
+
+        _, countdown_strip, x_pos = self.countdown_cache
         y_pos = 25  # Bottom of display
 
         # Grey color for countdown
-        grey_color = (64, 64, 64)
-        self.draw_text_pixels(countdown_pixels, x_pos, y_pos, grey_color)
+        self.draw_text_strip(countdown_strip, x_pos, y_pos, COUNTDOWN_GREY)
 
     def run_display(self):
         """Run the continuous MUNI display."""
@@ -960,27 +1187,53 @@ class MuniLTaravalDisplay:
         print()
         
         self.running = True
+
+        # Test data goes through the same poller, so the render loop never waits on a fetch
+        self.stop_event.clear()
+        self.poll_thread = threading.Thread(target=self.poll_live_data, daemon=True)
+        self.poll_thread.start()
         
         try:
+            frame_deadline = time.monotonic()
             while self.running:
                 self.display_arrivals()
 
                 # Two-mode update system
                 if self.animation_active:
-                    # Animation mode: High frequency for smooth FPS (20 FPS = 0.05s)
-                    time.sleep(0.05)
+                    # Animation mode: High frequency for smooth FPS (20 FPS = 0.05s), paced
+                    # against a deadline so drawing time doesn't stretch each frame
+                    frame_deadline += 0.05
+                    delay = frame_deadline - time.monotonic()
+                    if delay > 0:
+                        self.stop_event.wait(delay)
+                    else:
+                        frame_deadline = time.monotonic()  # Running behind; don't try to catch up
                 else:
-                    # Static mode: Update display every 5 seconds for responsiveness
-                    time.sleep(5)
+                    # Static mode: Update display every 5 seconds for responsiveness,
+                    # or as soon as the poller has new data
+                    self.arrivals_ready.wait(5)
+                    self.arrivals_ready.clear()
+                    frame_deadline = time.monotonic()
                 
         except KeyboardInterrupt:
             print("\n🛑 MUNI display stopped by user")
         finally:
             self.running = False
+            self.stop_event.set()
+            if self.poll_thread is not None:
+                self.poll_thread.join(timeout=2)
+                self.poll_thread = None
+            self.session.close()
             self.controller.stop()
             self.controller.clear()
             print("\n🎉 Thanks for using the MUNI L-Taraval display!")
 
+    def stop(self):
+        """Stop the display loop without waiting out the current frame or static wait."""
+        self.running = False
+        self.stop_event.set()
+        self.arrivals_ready.set()
+
 
 def main():
     """Run the MUNI L-Taraval display."""
@@ -990,16 +1243,10 @@ def main():
 
     # First, try to load from config file
     try:
-        if os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('MUNI_API_KEY='):
-                        api_key = line.split('=', 1)[1].strip().strip('"').strip("'")
-                        if api_key and api_key != 'YOUR_511_API_KEY_HERE':
-                            break
-                        api_key = None  # Reset if placeholder value
-    except Exception as e:
+        api_key = get_config(config_file, 'MUNI_API_KEY')
+        if api_key == 'YOUR_511_API_KEY_HERE':
+            api_key = None  # Reset if placeholder value
+    except (OSError, UnicodeDecodeError) as e:
         print(f"⚠️  Error reading API key from config: {e}")
 
     # If no valid key from config file, try environment variable
@@ -7,184 +7,58 @@ Displays "Hello SFELC 2025 AI Hackathon!" using pixel-based scrolling.
 import sys
 import os
 import time
+import numpy as np
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from matrix.emulator_controller import EmulatorController
 
+# Simple 5x7 font patterns for basic characters: one byte per row, bit 4 = left column
+FONT_PATTERNS = {
+    'H': bytes((0b10001, 0b10001, 0b10001, 0b11111, 0b10001, 0b10001, 0b10001)),
+    'E': bytes((0b11111, 0b10000, 0b10000, 0b11110, 0b10000, 0b10000, 0b11111)),
+    'L': bytes((0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b11111)),
+    'O': bytes((0b01110, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b01110)),
+    'S': bytes((0b01111, 0b10000, 0b10000, 0b01110, 0b00001, 0b00001, 0b11110)),
+    'F': bytes((0b11111, 0b10000, 0b10000, 0b11110, 0b10000, 0b10000, 0b10000)),
+    'C': bytes((0b01111, 0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b01111)),
+    'A': bytes((0b01110, 0b10001, 0b10001, 0b11111, 0b10001, 0b10001, 0b10001)),
+    'I': bytes((0b11111, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b11111)),
+    'T': bytes((0b11111, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100)),
+    'K': bytes((0b10001, 0b10010, 0b10100, 0b11000, 0b10100, 0b10010, 0b10001)),
+    'N': bytes((0b10001, 0b11001, 0b10101, 0b10011, 0b10001, 0b10001, 0b10001)),
+    '2': bytes((0b01110, 0b10001, 0b00001, 0b00010, 0b00100, 0b01000, 0b11111)),
+    '0': bytes((0b01110, 0b10001, 0b10011, 0b10101, 0b11001, 0b10001, 0b01110)),
+    '5': bytes((0b11111, 0b10000, 0b11110, 0b00001, 0b00001, 0b10001, 0b01110)),
+    '!': bytes((0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b00000, 0b00100)),
+    ' ': bytes((0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000)),
+}
+
 
 def create_text_pixels(text):
     """Create a pixel representation of text using a simple 5x7 font."""
-    # Simple 5x7 font patterns for basic characters
-    font_patterns = {
-        'H': [
-            [1,0,0,0,1],
-            [1,0,0,0,1],
-            [1,0,0,0,1],
-            [1,1,1,1,1],
-            [1,0,0,0,1],
-            [1,0,0,0,1],
-            [1,0,0,0,1]
-        ],
-        'E': [
-            [1,1,1,1,1],
-            [1,0,0,0,0],
-            [1,0,0,0,0],
-            [1,1,1,1,0],
-            [1,0,0,0,0],
-            [1,0,0,0,0],
-            [1,1,1,1,1]
-        ],
-        'L': [
-            [1,0,0,0,0],
-            [1,0,0,0,0],
-            [1,0,0,0,0],
-            [1,0,0,0,0],
-            [1,0,0,0,0],
-            [1,0,0,0,0],
-            [1,1,1,1,1]
-        ],
-        'O': [
-            [0,1,1,1,0],
-            [1,0,0,0,1],
-            [1,0,0,0,1],
-            [1,0,0,0,1],
-            [1,0,0,0,1],
-            [1,0,0,0,1],
-            [0,1,1,1,0]
-        ],
-        'S': [
-            [0,1,1,1,1],
-            [1,0,0,0,0],
-            [1,0,0,0,0],
-            [0,1,1,1,0],
-            [0,0,0,0,1],
-            [0,0,0,0,1],
-            [1,1,1,1,0]
-        ],
-        'F': [
-            [1,1,1,1,1],
-            [1,0,0,0,0],
-            [1,0,0,0,0],
-            [1,1,1,1,0],
-            [1,0,0,0,0],
-            [1,0,0,0,0],
-            [1,0,0,0,0]
-        ],
-        'C': [
-            [0,1,1,1,1],
-            [1,0,0,0,0],
-            [1,0,0,0,0],
-            [1,0,0,0,0],
-            [1,0,0,0,0],
-            [1,0,0,0,0],
-            [0,1,1,1,1]
-        ],
-        'A': [
-            [0,1,1,1,0],
-            [1,0,0,0,1],
-            [1,0,0,0,1],
-            [1,1,1,1,1],
-            [1,0,0,0,1],
-            [1,0,0,0,1],
-            [1,0,0,0,1]
-        ],
-        'I': [
-            [1,1,1,1,1],
-            [0,0,1,0,0],
-            [0,0,1,0,0],
-            [0,0,1,0,0],
-            [0,0,1,0,0],
-            [0,0,1,0,0],
-            [1,1,1,1,1]
-        ],
-        'T': [
-            [1,1,1,1,1],
-            [0,0,1,0,0],
-            [0,0,1,0,0],
-            [0,0,1,0,0],
-            [0,0,1,0,0],
-            [0,0,1,0,0],
-            [0,0,1,0,0]
-        ],
-        'K': [
-            [1,0,0,0,1],
-            [1,0,0,1,0],
-            [1,0,1,0,0],
-            [1,1,0,0,0],
-            [1,0,1,0,0],
-            [1,0,0,1,0],
-            [1,0,0,0,1]
-        ],
-        'N': [
-            [1,0,0,0,1],
-            [1,1,0,0,1],
-            [1,0,1,0,1],
-            [1,0,0,1,1],
-            [1,0,0,0,1],
-            [1,0,0,0,1],
-            [1,0,0,0,1]
-        ],
-        '2': [
-            [0,1,1,1,0],
-            [1,0,0,0,1],
-            [0,0,0,0,1],
-            [0,0,0,1,0],
-            [0,0,1,0,0],
-            [0,1,0,0,0],
-            [1,1,1,1,1]
-        ],
-        '0': [
-            [0,1,1,1,0],
-            [1,0,0,0,1],
-            [1,0,0,1,1],
-            [1,0,1,0,1],
-            [1,1,0,0,1],
-            [1,0,0,0,1],
-            [0,1,1,1,0]
-        ],
-        '5': [
-            [1,1,1,1,1],
-            [1,0,0,0,0],
-            [1,1,1,1,0],
-            [0,0,0,0,1],
-            [0,0,0,0,1],
-            [1,0,0,0,1],
-            [0,1,1,1,0]
-        ],
-        '!': [
-            [0,0,1,0,0],
-            [0,0,1,0,0],
-            [0,0,1,0,0],
-            [0,0,1,0,0],
-            [0,0,1,0,0],
-            [0,0,0,0,0],
-            [0,0,1,0,0]
-        ],
-        ' ': [
-            [0,0,0,0,0],
-            [0,0,0,0,0],
-            [0,0,0,0,0],
-            [0,0,0,0,0],
-            [0,0,0,0,0],
-            [0,0,0,0,0],
-            [0,0,0,0,0]
-        ]
-    }
-    
     # Convert text to pixel array
     text_pixels = []
     for char in text.upper():
-        if char in font_patterns:
-            text_pixels.append(font_patterns[char])
+        if char in FONT_PATTERNS:
+            text_pixels.append(FONT_PATTERNS[char])
         else:
             # Use space for unknown characters
-            text_pixels.append(font_patterns[' '])
+            text_pixels.append(FONT_PATTERNS[' '])
     
     return text_pixels
 
 
+def create_text_mask(text_pixels):
+    """Lay text out as one 7-row boolean mask (5 pixels per char + 1 space)."""
+    rows = np.array([list(char_pixels) for char_pixels in text_pixels], dtype=np.uint8)
+    # Shift bit 4 (the left column) up to bit 7 so unpackbits yields columns left to right;
+    # the 6th bit is always 0 and becomes the space after each character
+    columns = np.unpackbits(rows[:, :, None] << 3, axis=2)[:, :, :6]
+    return columns.transpose(1, 0, 2).reshape(7, -1)[:, :-1].astype(bool)
+
+
 def main():
     """Display the SFELC 2025 AI Hackathon message using pixels."""
     print("🚀 SFELC 2025 AI Hackathon Pixel Display")
@@ -200,11 +74,16 @@ def main():
     # The hackathon message
     message = "HELLO SFELC 2025 AI HACKATHON!"
     
-    # Create pixel representation
+    # Create pixel representation, laid out once as a mask of the whole message
     text_pixels = create_text_pixels(message)
-    
+    text_mask = create_text_mask(text_pixels)
+
     # Calculate total width (5 pixels per char + 1 space between chars)
     total_width = len(text_pixels) * 6 - 1
+
+    # The whole message pre-rendered with a screen of blank padding on each side;
+    # every frame is just a 64-column window into this strip
+    strip = np.zeros((32, total_width + 128, 3), dtype=np.uint8)
     
     # Bright, eye-catching colors for the hackathon
     colors = [
@@ -224,37 +103,24 @@ def main():
         
         color_index = 0
         scroll_position = 64  # Start from right edge
+        strip_color = None
+        next_frame = time.monotonic()
         
         while True:
             # Get current color
             current_color = colors[color_index % len(colors)]
-            
-            # Clear the display
-            controller.clear()
-            
-            if hasattr(controller, 'canvas') and controller.canvas:
-                # Draw the text at current scroll position
-                char_x = scroll_position
-                
-                for char_pixels in text_pixels:
-                    # Draw each character
-                    for y in range(7):  # 7 rows in font
-                        for x in range(5):  # 5 columns in font
-                            if char_pixels[y][x] == 1:
-                                pixel_x = char_x + x
-                                pixel_y = 12 + y  # Center vertically (32/2 - 7/2 ≈ 12)
-                                
-                                # Only draw if pixel is visible on screen
-                                if 0 <= pixel_x < 64 and 0 <= pixel_y < 32:
-                                    controller.canvas.SetPixel(
-                                        pixel_x, pixel_y, 
-                                        current_color[0], current_color[1], current_color[2]
-                                    )
-                    
-                    char_x += 6  # Move to next character position (5 + 1 space)
-                
-                # Update the display
-                controller.canvas = controller.matrix.SwapOnVSync(controller.canvas)
+
+            # Repaint the strip only when the color changes
+            if current_color != strip_color:
+                strip[12:19, 64:64 + total_width][text_mask] = current_color  # Center vertically (32/2 - 7/2 ≈ 12)
+                strip_color = current_color
+
+            # Window onto the strip for the current scroll position
+            offset = 64 - scroll_position
+            frame = strip[:, offset:offset + 64]
+
+            # Update the display
+            controller.show_frame(frame)
             
             # Move scroll position
             scroll_position -= 1
@@ -265,8 +131,14 @@ def main():
                 color_index += 1  # Change color when text loops
                 print(f"📱 Switching to color: RGB{colors[color_index % len(colors)]}")
             
-            # Control scroll speed
-            time.sleep(0.08)  # Adjust for desired scroll speed
+            # Control scroll speed on a fixed schedule, so drawing time doesn't
+            # stretch the frame interval
+            next_frame += 0.08  # Adjust for desired scroll speed
+            remaining = next_frame - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            else:
+                next_frame = time.monotonic()
             
     except KeyboardInterrupt:
         print("\n🛑 Hackathon display stopped by user")
@@ -6,6 +6,7 @@ Simple RGB Matrix Emulator Demo - Basic demonstration with the graphical emulato
 import sys
 import os
 import time
+import numpy as np
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -25,127 +26,93 @@ def main():
     # Initialize the emulator controller
     controller = EmulatorController(use_emulator=True)
     
+    # One framebuffer shared by every demo: each demo redraws it and pushes it with
+    # show_frame(), so no separate clear-and-swap is needed between demos
+    fb = np.zeros((32, 64, 3), dtype=np.uint8)
+    xs = np.arange(64)[np.newaxis, :]
+    ys = np.arange(32)[:, np.newaxis]
+    
     try:
         # Demo 1: Simple pixel drawing
         print("Demo 1: Drawing individual pixels...")
-        controller.clear()
+        fb[:] = 0
         
-        # Draw some pixels directly on the canvas
-        if hasattr(controller, 'canvas') and controller.canvas:
-            # Draw a border around the 64x32 matrix
-            for x in range(64):
-                controller.canvas.SetPixel(x, 0, 255, 0, 0)    # Top border - red
-                controller.canvas.SetPixel(x, 31, 255, 0, 0)   # Bottom border - red
-            
-            for y in range(32):
-                controller.canvas.SetPixel(0, y, 0, 255, 0)    # Left border - green
-                controller.canvas.SetPixel(63, y, 0, 255, 0)   # Right border - green
-            
-            # Draw some diagonal lines
-            for i in range(min(64, 32)):
-                controller.canvas.SetPixel(i, i, 0, 0, 255)    # Blue diagonal
-                controller.canvas.SetPixel(63-i, i, 255, 255, 0)  # Yellow diagonal
-            
-            # Update the display
-            controller.canvas = controller.matrix.SwapOnVSync(controller.canvas)
+        # Draw a border around the 64x32 matrix
+        fb[0, :] = (255, 0, 0)     # Top border - red
+        fb[31, :] = (255, 0, 0)    # Bottom border - red
+        fb[:, 0] = (0, 255, 0)     # Left border - green
+        fb[:, 63] = (0, 255, 0)    # Right border - green
+        
+        # Draw some diagonal lines
+        i = np.arange(min(64, 32))
+        fb[i, i] = (0, 0, 255)        # Blue diagonal
+        fb[i, 63 - i] = (255, 255, 0)  # Yellow diagonal
+        
+        # Update the display
+        controller.show_frame(fb)
             
         time.sleep(3)
         
         # Demo 2: Color patterns
         print("Demo 2: Color patterns...")
-        controller.clear()
         
-        if hasattr(controller, 'canvas') and controller.canvas:
-            # Create a rainbow pattern
-            for x in range(64):
-                for y in range(32):
-                    r = int(255 * (x / 64))
-                    g = int(255 * (y / 32))
-                    b = int(255 * ((x + y) / (64 + 32)))
-                    controller.canvas.SetPixel(x, y, r, g, b)
-            
-            controller.canvas = controller.matrix.SwapOnVSync(controller.canvas)
+        # Create a rainbow pattern, broadcasting column and row ramps over the whole frame
+        fb[:, :, 0] = 255 * (xs / 64)
+        fb[:, :, 1] = 255 * (ys / 32)
+        fb[:, :, 2] = 255 * ((xs + ys) / (64 + 32))
+        controller.show_frame(fb)
             
         time.sleep(3)
         
         # Demo 3: Simple animation
         print("Demo 3: Simple animation...")
+        fb[:] = 0
+        # Trail fades from the dot backwards: brightness 255, 205, 155, 105, 55
+        trail_offsets = np.arange(5)
+        trail_brightness = 255 - trail_offsets * 50
+        trail_colors = np.stack([trail_brightness, np.zeros(5, int), trail_brightness], axis=1).astype(np.uint8)
+        # show_frame() is a no-op without a canvas, so the loop needs no canvas check
         for frame in range(64):
-            controller.clear()
+            # Moving dot; only its row ever changes
+            x = frame % 64
+            y = 16  # Center vertically
+            fb[y] = 0
+            
+            # Draw a moving dot with trail, wrapping around the left edge
+            fb[y, (x - trail_offsets) % 64] = trail_colors
             
-            if hasattr(controller, 'canvas') and controller.canvas:
-                # Moving dot
-                x = frame % 64
-                y = 16  # Center vertically
-                
-                # Draw a moving dot with trail
-                for i in range(5):
-                    trail_x = (x - i) % 64
-                    brightness = 255 - (i * 50)
-                    if brightness > 0:
-                        controller.canvas.SetPixel(trail_x, y, brightness, 0, brightness)
-                
-                controller.canvas = controller.matrix.SwapOnVSync(controller.canvas)
+            controller.show_frame(fb)
             
             time.sleep(0.1)
         
         # Demo 4: Text simulation (since text rendering has issues)
         print("Demo 4: Text simulation with pixels...")
-        controller.clear()
+        fb[:] = 0
         
-        if hasattr(controller, 'canvas') and controller.canvas:
-            # Draw "64x32" using pixel patterns
-            # Simple 5x7 font patterns for "64x32"
-            
-            # Draw "6"
-            for y in range(7):
-                for x in range(4):
-                    if (x, y) in [(0,0),(1,0),(2,0),(0,1),(0,2),(0,3),(1,3),(2,3),(3,3),(0,4),(3,4),(0,5),(3,5),(1,6),(2,6)]:
-                        controller.canvas.SetPixel(x + 5, y + 12, 255, 255, 255)
-            
-            # Draw "4"
-            for y in range(7):
-                for x in range(4):
-                    if (x, y) in [(0,0),(0,1),(0,2),(0,3),(1,3),(2,3),(3,3),(3,0),(3,1),(3,2),(3,3),(3,4),(3,5),(3,6)]:
-                        controller.canvas.SetPixel(x + 10, y + 12, 255, 255, 255)
-            
-            # Draw "x"
-            for y in range(5):
-                for x in range(4):
-                    if (x, y) in [(0,0),(3,4),(1,1),(2,3),(2,1),(1,3),(3,0),(0,4)]:
-                        controller.canvas.SetPixel(x + 16, y + 14, 255, 255, 0)
-            
-            # Draw "3"
-            for y in range(7):
-                for x in range(4):
-                    if (x, y) in [(0,0),(1,0),(2,0),(3,1),(3,2),(1,3),(2,3),(3,4),(3,5),(0,6),(1,6),(2,6)]:
-                        controller.canvas.SetPixel(x + 22, y + 12, 255, 255, 255)
-            
-            # Draw "2"
-            for y in range(7):
-                for x in range(4):
-                    if (x, y) in [(0,0),(1,0),(2,0),(3,1),(3,2),(2,3),(1,4),(0,5),(0,6),(1,6),(2,6),(3,6)]:
-                        controller.canvas.SetPixel(x + 27, y + 12, 255, 255, 255)
-            
-            controller.canvas = controller.matrix.SwapOnVSync(controller.canvas)
+        # Draw "64x32" using pixel patterns: 4-wide glyphs packed into one int each,
+        # with bit (y * 4 + x) set for every lit pixel
+        glyphs = [
+            (0x699F117, 5, 12, (255, 255, 255)),   # "6"
+            (0x888F999, 10, 12, (255, 255, 255)),  # "4"
+            (0x96069, 16, 14, (255, 255, 0)),      # "x"
+            (0x7886887, 22, 12, (255, 255, 255)),  # "3"
+            (0xF124887, 27, 12, (255, 255, 255)),  # "2"
+        ]
+        for bits, x0, y0, color in glyphs:
+            glyph_ys, glyph_xs = np.divmod(np.flatnonzero((bits >> np.arange(28)) & 1), 4)
+            fb[y0 + glyph_ys, x0 + glyph_xs] = color
+        controller.show_frame(fb)
         
         time.sleep(5)
         
         # Final message
         print("Demo complete! Matrix display is working perfectly!")
-        controller.clear()
         
         # Show a final pattern
-        if hasattr(controller, 'canvas') and controller.canvas:
-            # Checkerboard pattern
-            for x in range(64):
-                for y in range(32):
-                    if (x + y) % 2 == 0:
-                        controller.canvas.SetPixel(x, y, 0, 255, 0)
-                    else:
-                        controller.canvas.SetPixel(x, y, 255, 0, 255)
-            
-            controller.canvas = controller.matrix.SwapOnVSync(controller.canvas)
+        # Checkerboard pattern: green where x + y is even, magenta where it is odd
+        odd = ((xs + ys) % 2 == 1)[:, :, np.newaxis]
+        fb[:] = np.where(odd, np.uint8([255, 0, 255]), np.uint8([0, 255, 0]))
+        controller.show_frame(fb)
         
         time.sleep(3)
         controller.clear()
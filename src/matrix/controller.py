@@ -3,8 +3,10 @@
 RGB Matrix Controller - Main controller class for managing RGB LED matrix displays.
 """
 
+import copy
 import time
 import threading
+from functools import lru_cache
 from typing import Optional, Tuple, Union
 from PIL import Image, ImageDraw, ImageFont
 import yaml
@@ -18,6 +20,17 @@ except ImportError:
     MATRIX_AVAILABLE = False
 
 
+# libyaml's C parser when PyYAML was built with it, else the pure-Python safe loader
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=4)
+def _parse_config_file(config_path: str, mtime_ns: int) -> dict:
+    """Parse a YAML config file, cached until the file's mtime changes."""
+    with open(config_path, 'r') as file:
+        return yaml.load(file, Loader=_YAML_LOADER)
+
+
 class MatrixController:
     """Main controller for RGB LED matrix operations."""
     
@@ -28,6 +41,13 @@ class MatrixController:
         self.canvas = None
         self.running = False
         self._current_thread = None
+        # Set by stop() so a sleeping worker wakes and exits immediately
+        self._stop_event = threading.Event()
+        # Loaded BDF fonts and graphics colors, reused across frames and clock ticks
+        self._font_cache = {}
+        self._color_cache = {}
+        # Persistent image that show_frame() copies each NumPy frame into
+        self._frame_image = None
         
         if MATRIX_AVAILABLE:
             self._setup_matrix()
@@ -37,11 +57,12 @@ class MatrixController:
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from YAML file."""
         try:
-            with open(config_path, 'r') as file:
-                return yaml.safe_load(file)
+            config = _parse_config_file(config_path, os.stat(config_path).st_mtime_ns)
         except FileNotFoundError:
             print(f"Config file {config_path} not found. Using defaults.")
             return self._default_config()
+        # Each controller gets its own copy of the shared parse
+        return copy.deepcopy(config)
     
     def _default_config(self) -> dict:
         """Return default configuration."""
@@ -81,6 +102,18 @@ class MatrixController:
         else:
             print("SIMULATION: Matrix cleared")
     
+    def show_frame(self, frame):
+        """Push a (rows, cols, 3) uint8 NumPy frame to the matrix with one SetImage call."""
+        if not (MATRIX_AVAILABLE and self.canvas):
+            return  # No display to push to; frames are too frequent to log
+        
+        if self._frame_image is None:
+            self._frame_image = Image.new('RGB', (self.matrix.width, self.matrix.height))
+        # Refill the same image in place rather than allocating one per frame
+        self._frame_image.frombytes(frame.tobytes())
+        self.canvas.SetImage(self._frame_image)
+        self.canvas = self.matrix.SwapOnVSync(self.canvas)
+    
     def display_text(self, text: str, color: Tuple[int, int, int] = (255, 255, 255), 
                     scroll: bool = False, font_path: Optional[str] = None):
         """Display text on the matrix."""
@@ -93,68 +126,90 @@ class MatrixController:
         else:
             self._static_text(text, color, font_path)
     
+    def _get_font(self, font_path: Optional[str]):
+        """Return the loaded font for a path, loading each BDF file only once."""
+        if not (font_path and os.path.exists(font_path)):
+            font_path = self.config['display'].get('default_font', "assets/fonts/6x10.bdf")
+        font = self._font_cache.get(font_path)
+        if font is None:
+            font = graphics.Font()
+            font.LoadFont(font_path)
+            self._font_cache[font_path] = font
+        return font
+    
+    def _get_color(self, color: Tuple[int, int, int]):
+        """Return a cached graphics.Color for an RGB tuple."""
+        color = tuple(color)
+        text_color = self._color_cache.get(color)
+        if text_color is None:
+            text_color = self._color_cache[color] = graphics.Color(*color)
+        return text_color
+    
     def _static_text(self, text: str, color: Tuple[int, int, int], font_path: Optional[str]):
         """Display static text."""
         self.canvas.Clear()
         
-        if font_path and os.path.exists(font_path):
-            font = graphics.Font()
-            font.LoadFont(font_path)
-        else:
-            font = graphics.Font()
-            font.LoadFont("assets/fonts/6x10.bdf")  # Default font
-        
-        text_color = graphics.Color(color[0], color[1], color[2])
+        font = self._get_font(font_path)
+        text_color = self._get_color(color)
         graphics.DrawText(self.canvas, font, 2, 10, text_color, text)
         
         self.canvas = self.matrix.SwapOnVSync(self.canvas)
     
     def _scroll_text(self, text: str, color: Tuple[int, int, int], font_path: Optional[str]):
         """Scroll text across the matrix."""
-        self.running = True
-        
         def scroll_worker():
-            font = graphics.Font()
-            if font_path and os.path.exists(font_path):
-                font.LoadFont(font_path)
-            else:
-                font.LoadFont("assets/fonts/6x10.bdf")
-            
-            text_color = graphics.Color(color[0], color[1], color[2])
+            font = self._get_font(font_path)
+            text_color = self._get_color(color)
             pos = self.matrix.width
+            delay = self.config['display']['scroll_speed']
+            next_frame = time.monotonic()
             
-            while self.running:
+            while not self._stop_event.is_set():
                 self.canvas.Clear()
                 length = graphics.DrawText(self.canvas, font, pos, 10, text_color, text)
                 pos -= 1
                 if pos + length < 0:
                     pos = self.matrix.width
                 
-                time.sleep(self.config['display']['scroll_speed'])
+                # Sleep to the next frame deadline so drawing time doesn't add to the
+                # delay; if we fell behind, restart the schedule rather than burst
+                next_frame += delay
+                remaining = next_frame - time.monotonic()
+                if remaining > 0:
+                    self._stop_event.wait(remaining)
+                else:
+                    next_frame = time.monotonic()
                 self.canvas = self.matrix.SwapOnVSync(self.canvas)
         
+        # Stop the previous worker before flagging this one as running
         if self._current_thread and self._current_thread.is_alive():
             self.stop()
+        self.running = True
+        self._stop_event.clear()
         
         self._current_thread = threading.Thread(target=scroll_worker)
         self._current_thread.start()
     
-    def display_image(self, image_path: str):
-        """Display an image on the matrix."""
+    def display_image(self, image_path: str, resample: int = Image.BILINEAR):
+        """Display an image on the matrix, downscaled with the given Pillow resample filter.
+
+        BILINEAR is much faster than LANCZOS and looks the same at panel resolution;
+        pass resample=Image.LANCZOS for the sharper (previous default) downscale.
+        """
         if not MATRIX_AVAILABLE:
             print(f"SIMULATION: Display image '{image_path}'")
             return
         
         try:
             image = Image.open(image_path)
-            image = image.resize((self.matrix.width, self.matrix.height), Image.LANCZOS)
+            # BILINEAR by default: on a 64x32 panel LANCZOS's extra taps cost far more
+            # time without a visible difference; pass Image.LANCZOS for photos if wanted
+            image = image.resize((self.matrix.width, self.matrix.height), resample)
             image = image.convert('RGB')
             
-            self.canvas.Clear()
-            for y in range(self.matrix.height):
-                for x in range(self.matrix.width):
-                    r, g, b = image.getpixel((x, y))
-                    self.canvas.SetPixel(x, y, r, g, b)
+            # The image already covers the whole panel, so blit it in one call
+            # instead of a getpixel/SetPixel pair per pixel
+            self.canvas.SetImage(image)
             
             self.canvas = self.matrix.SwapOnVSync(self.canvas)
         except Exception as e:
@@ -162,19 +217,27 @@ class MatrixController:
     
     def start_clock(self, format: str = "24h"):
         """Start a real-time clock display."""
-        self.running = True
-        
         def clock_worker():
-            while self.running:
-                current_time = time.strftime("%H:%M:%S" if format == "24h" else "%I:%M:%S %p")
-                if MATRIX_AVAILABLE:
-                    self._static_text(current_time, (0, 255, 0), None)
-                else:
-                    print(f"SIMULATION: Clock display - {current_time}")
-                time.sleep(1)
+            time_format = "%H:%M:%S" if format == "24h" else "%I:%M:%S %p"
+            last_time = None
+            while not self._stop_event.is_set():
+                current_time = time.strftime(time_format)
+                # Only redraw when the displayed text actually changes
+                if current_time != last_time:
+                    last_time = current_time
+                    if MATRIX_AVAILABLE:
+                        self._static_text(current_time, (0, 255, 0), None)
+                    else:
+                        print(f"SIMULATION: Clock display - {current_time}")
+                # Wake at the next whole second rather than 1s after drawing, so drawing
+                # time never accumulates into a skipped second
+                self._stop_event.wait(1 - time.time() % 1)
         
+        # Stop the previous worker before flagging this one as running
         if self._current_thread and self._current_thread.is_alive():
             self.stop()
+        self.running = True
+        self._stop_event.clear()
         
         self._current_thread = threading.Thread(target=clock_worker)
         self._current_thread.start()
@@ -182,13 +245,17 @@ class MatrixController:
     def stop(self):
         """Stop any running display operations."""
         self.running = False
+        self._stop_event.set()
         if self._current_thread and self._current_thread.is_alive():
             self._current_thread.join(timeout=2)
     
     def set_brightness(self, brightness: int):
         """Set matrix brightness (0-100)."""
         if MATRIX_AVAILABLE and self.matrix:
-            self.matrix.brightness = max(0, min(100, brightness))
+            brightness = max(0, min(100, brightness))
+            # Assigning brightness reconfigures the panel, so skip no-op writes
+            if self.matrix.brightness != brightness:
+                self.matrix.brightness = brightness
         else:
             print(f"SIMULATION: Set brightness to {brightness}")
     
@@ -5,6 +5,8 @@ RGB Matrix Web Interface - Flask web app for controlling the matrix remotely.
 
 import sys
 import os
+import json
+import threading
 from flask import Flask, render_template, request, jsonify
 from flask_socketio import SocketIO, emit
 
@@ -13,19 +15,81 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from matrix.controller import MatrixController
 
+# orjson encodes and parses JSON straight to/from bytes and much faster; fall back to
+# jsonify and the json module
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+def is_string(value):
+    """True for a JSON string."""
+    return isinstance(value, str)
+
+def is_flag(value):
+    """True for a JSON true/false."""
+    return isinstance(value, bool)
+
+def is_number(value):
+    """True for a JSON number."""
+    # bool is a subclass of int, but true/false is not a brightness
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def is_color(value):
+    """True for an [r, g, b] list of ints in 0-255."""
+    return (isinstance(value, list) and len(value) == 3 and
+            all(isinstance(c, int) and not isinstance(c, bool) and 0 <= c <= 255 for c in value))
+
+# JSON body fields each endpoint accepts: name -> (validator, default)
+TEXT_FIELDS = {'text': (is_string, 'Hello World!'), 'color': (is_color, [255, 255, 255]), 'scroll': (is_flag, False)}
+CLOCK_FIELDS = {'format': (is_string, '24h')}
+BRIGHTNESS_FIELDS = {'brightness': (is_number, 50)}
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'rgb-matrix-secret-key'
 socketio = SocketIO(app, cors_allowed_origins="*")
 
-# Global matrix controller
+def json_response(payload, status=200):
+    """Build a JSON API response, encoded with orjson when it is installed."""
+    if orjson is None:
+        return jsonify(payload), status
+    return app.response_class(orjson.dumps(payload), status=status, mimetype='application/json')
+
+def parse_body(fields):
+    """Read the request's JSON object, filling defaults; returns (values, error message)."""
+    body = request.get_data(cache=False)
+    try:
+        data = json_loads(body) if body else {}
+    except ValueError:
+        return None, 'Request body is not valid JSON'
+    if not isinstance(data, dict):
+        return None, 'Request body must be a JSON object'
+    
+    values = {}
+    for name, (is_valid, default) in fields.items():
+        value = data.get(name, default)
+        if not is_valid(value):
+            return None, f"Invalid value for '{name}'"
+        values[name] = value
+    return values, None
+
+# Global matrix controller, created on first use so importing the app doesn't grab the panel
 matrix_controller = None
+_controller_lock = threading.Lock()
 
 def get_controller():
     """Get or create matrix controller instance."""
     global matrix_controller
-    if matrix_controller is None:
-        matrix_controller = MatrixController()
-    return matrix_controller
+    controller = matrix_controller
+    if controller is None:
+        # Requests are served on several threads; only the first may build the controller
+        with _controller_lock:
+            if matrix_controller is None:
+                matrix_controller = MatrixController()
+            controller = matrix_controller
+    return controller
 
 @app.route('/')
 def index():
@@ -35,18 +99,20 @@ def index():
 @app.route('/api/display/text', methods=['POST'])
 def display_text():
     """API endpoint to display text."""
+    data, error = parse_body(TEXT_FIELDS)
+    if error:
+        return json_response({'status': 'error', 'message': error}, 400)
     try:
-        data = request.get_json()
-        text = data.get('text', 'Hello World!')
-        color = data.get('color', [255, 255, 255])
-        scroll = data.get('scroll', False)
+        text = data['text']
+        color = data['color']
+        scroll = data['scroll']
         
         controller = get_controller()
         controller.display_text(text, tuple(color), scroll)
         
-        return jsonify({'status': 'success', 'message': f'Displaying: {text}'})
+        return json_response({'status': 'success', 'message': f'Displaying: {text}'})
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+        return json_response({'status': 'error', 'message': str(e)}, 500)
 
 @app.route('/api/display/clear', methods=['POST'])
 def clear_display():
@@ -54,50 +120,58 @@ def clear_display():
     try:
         controller = get_controller()
         controller.clear()
-        return jsonify({'status': 'success', 'message': 'Display cleared'})
+        return json_response({'status': 'success', 'message': 'Display cleared'})
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+        return json_response({'status': 'error', 'message': str(e)}, 500)
 
 @app.route('/api/clock/start', methods=['POST'])
 def start_clock():
     """API endpoint to start the clock."""
+    data, error = parse_body(CLOCK_FIELDS)
+    if error:
+        return json_response({'status': 'error', 'message': error}, 400)
     try:
-        data = request.get_json()
-        format_type = data.get('format', '24h')
+        format_type = data['format']
         
         controller = get_controller()
         controller.start_clock(format_type)
         
-        return jsonify({'status': 'success', 'message': f'Clock started ({format_type})'})
+        return json_response({'status': 'success', 'message': f'Clock started ({format_type})'})
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+        return json_response({'status': 'error', 'message': str(e)}, 500)
 
 @app.route('/api/brightness', methods=['POST'])
 def set_brightness():
     """API endpoint to set brightness."""
+    data, error = parse_body(BRIGHTNESS_FIELDS)
+    if error:
+        return json_response({'status': 'error', 'message': error}, 400)
     try:
-        data = request.get_json()
-        brightness = data.get('brightness', 50)
+        brightness = data['brightness']
         
         controller = get_controller()
         controller.set_brightness(brightness)
         
-        return jsonify({'status': 'success', 'message': f'Brightness set to {brightness}'})
+        return json_response({'status': 'success', 'message': f'Brightness set to {brightness}'})
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+        return json_response({'status': 'error', 'message': str(e)}, 500)
 
 @socketio.on('connect')
 def handle_connect():
     """Handle client connection."""
-    print('Client connected')
+    # Per-connection chatter goes to the app logger, silent unless debugging
+    app.logger.info('Client connected')
     emit('status', {'message': 'Connected to RGB Matrix Controller'})
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """Handle client disconnection."""
-    print('Client disconnected')
+    app.logger.info('Client disconnected')
 
 if __name__ == '__main__':
     print("🌐 Starting RGB Matrix Web Interface...")
     print("📱 Open your browser to http://localhost:5000")
-    socketio.run(app, host='0.0.0.0', port=5000, debug=True)
+    # Debug mode's reloader runs the app in a second process (and a second
+    # MatrixController) and polls every source file, so it is opt-in
+    debug = os.environ.get('FLASK_DEBUG') == '1'
+    socketio.run(app, host='0.0.0.0', port=5000, debug=debug, use_reloader=debug)